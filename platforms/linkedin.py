@@ -3,16 +3,51 @@
 from __future__ import annotations
 
 import logging
+import re
 from typing import Any, Dict, List, Optional
 from urllib.parse import quote_plus
 
-from selenium.webdriver.common.by import By
-
-from utils.browser_utils import create_stealth_driver, human_scroll, clear_cookies
-from utils.rate_limiting import linkedin_delay
+from utils.browser_utils import human_scroll
+from utils.driver_pool import StealthDriverPool, get_pool
+from utils.linkedin_cache import LinkedInCache, SeenProfileStore
+from utils.rate_limiting import TokenBucket
 
 logger = logging.getLogger(__name__)
 
+# Classifies result links as person profiles or company pages in one pass.
+_PROFILE_RE = re.compile(r"linkedin\.com/(in|company)/")
+_LINK_KINDS = {"in": "profile", "company": "company"}
+
+LINKEDIN_DOMAIN = "linkedin.com"
+
+# Number of profile results collected per search.
+SEARCH_RESULT_LIMIT = 10
+
+# Sustained LinkedIn request pace (one request a minute) and allowed burst.
+LINKEDIN_RATE = 1 / 60
+LINKEDIN_BURST = 3
+LINKEDIN_JITTER = 5.0
+
+# Collects every profile field in a single WebDriver round trip.
+_PROFILE_INFO_JS = """
+const text = (selector) => {
+    const el = document.querySelector(selector);
+    return el ? el.innerText : null;
+};
+return {
+    name: text('h1'),
+    headline: text('div.text-body-medium'),
+    location: text('span.text-body-small'),
+    title: document.title,
+};
+"""
+
+
+def _is_throttled(title: str | None) -> bool:
+    """Return True when a page title indicates LinkedIn is rate limiting us."""
+    lowered = (title or "").lower()
+    return "429" in lowered or "too many requests" in lowered
+
 
 class LinkedInFinder:
     """Browser-based LinkedIn profile finder.
@@ -21,86 +56,139 @@ class LinkedInFinder:
     with undetected-chromedriver. It incorporates randomized behaviour and
     conservative rate limiting to help avoid detection. Only publicly available
     data should be scraped with this tool.
+
+    Browser instances are borrowed from a :class:`StealthDriverPool` for each
+    operation, so one finder may safely be shared across threads.
     """
 
-    def __init__(self, *, headless: bool = True, session_rotation: int = 5) -> None:
+    def __init__(
+        self,
+        *,
+        headless: bool = True,
+        session_rotation: int = 5,
+        pool: StealthDriverPool | None = None,
+        cache: LinkedInCache | None = None,
+        rate_limiter: TokenBucket | None = None,
+        seen_store: SeenProfileStore | None = None,
+    ) -> None:
         self.headless = headless
         self.rotation_limit = session_rotation
-        self._results_count = 0
-        self.driver = create_stealth_driver(headless=headless)
-
-    def _rotate_session(self) -> None:
-        """Rotate the browser session after a number of operations."""
-        logger.debug("Rotating browser session")
-        try:
-            self.driver.quit()
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("Error quitting driver during rotation: %s", exc)
-        self.driver = create_stealth_driver(headless=self.headless)
-        clear_cookies(self.driver)
-        self._results_count = 0
-
-    def _check_rotation(self) -> None:
-        if self._results_count >= self.rotation_limit:
-            self._rotate_session()
+        self.pool = pool or get_pool(headless=headless, max_uses=session_rotation)
+        self.cache = cache
+        self.rate_limiter = rate_limiter or TokenBucket(
+            LINKEDIN_RATE, LINKEDIN_BURST, jitter=LINKEDIN_JITTER
+        )
+        self.seen_store = seen_store
+        self._search_cache: Dict[str, List[Dict[str, Any]]] = {}
 
     def close(self) -> None:
-        """Close the underlying driver."""
-        try:
-            self.driver.quit()
-        except Exception:  # noqa: BLE001
-            pass
-
-    def search_profiles(self, query: str) -> List[Dict[str, Any]]:
-        """Search LinkedIn for public profiles matching the query."""
-        linkedin_delay()
+        """Release resources held by the finder.
+
+        Drivers belong to the (usually shared) pool, which is closed by its
+        owner or via :func:`utils.driver_pool.close_pool`.
+        """
+
+    def search_profiles(
+        self, query: str, *, include_companies: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Search LinkedIn for public profiles matching the query.
+
+        Each result has a ``url`` and a ``kind`` of ``"profile"``. Company
+        pages linked from the results are only included, with ``kind``
+        ``"company"``, when ``include_companies`` is set.
+        """
+        return [
+            r for r in self._search_links(query)
+            if include_companies or r["kind"] == "profile"
+        ]
+
+    def _search_links(self, query: str) -> List[Dict[str, Any]]:
+        """Return the classified profile and company links of a search."""
+        from selenium.webdriver.common.by import By
+
+        memo_key = " ".join(query.lower().split())
+        if memo_key in self._search_cache:
+            return self._search_cache[memo_key]
+        cache_key = f"search:{memo_key}"
+        if self.cache:
+            cached = self.cache.get(cache_key, normalize=False)
+            if cached is not None:
+                self._search_cache[memo_key] = cached
+                return cached
+        self.rate_limiter.acquire()
         url = (
             "https://www.linkedin.com/search/results/people/?keywords="
             f"{quote_plus(query)}"
         )
         logger.debug("Navigating to %s", url)
-        self.driver.get(url)
-        human_scroll(self.driver)
-
-        results: List[Dict[str, Any]] = []
-        cards = self.driver.find_elements(By.CSS_SELECTOR, "a.app-aware-link")
-        for card in cards:
-            href = card.get_attribute("href")
-            if href and "linkedin.com/in/" in href:
-                results.append({"url": href})
-            if len(results) >= 10:
-                break
-        self._results_count += 1
-        self._check_rotation()
+        with self.pool.lease(domain=LINKEDIN_DOMAIN) as driver:
+            driver.get(url)
+            results: List[Dict[str, Any]] = []
+            if _is_throttled(driver.title):
+                self.rate_limiter.penalize()
+                return results
+            # The first results are usually in the initial render; only scroll
+            # to trigger lazy loading when they are not.
+            cards = driver.find_elements(By.CSS_SELECTOR, "a.app-aware-link")
+            if len(cards) < SEARCH_RESULT_LIMIT:
+                human_scroll(driver)
+                cards = driver.find_elements(By.CSS_SELECTOR, "a.app-aware-link")
+            profiles = 0
+            for card in cards:
+                href = card.get_attribute("href")
+                match = _PROFILE_RE.search(href) if href else None
+                if match:
+                    kind = _LINK_KINDS[match.group(1)]
+                    results.append({"url": href, "kind": kind})
+                    profiles += kind == "profile"
+                if profiles >= SEARCH_RESULT_LIMIT:
+                    break
+        if self.cache and results:
+            self.cache.put(cache_key, results, normalize=False)
+        self._search_cache[memo_key] = results
         return results
 
     def extract_public_info(self, profile_url: str) -> Dict[str, Optional[str]]:
-        """Extract public information from a profile URL."""
-        linkedin_delay()
-        logger.debug("Fetching profile %s", profile_url)
-        self.driver.get(profile_url)
-        human_scroll(self.driver)
+        """Extract public information from a profile URL.
+
+        A fresh cache entry is returned as is. Profiles in ``seen_store`` are
+        not navigated to again: their last cached payload is returned whatever
+        its age, and they are only fetched live when none is cached. Other
+        profiles are fetched live and, on success, recorded as seen.
+        """
+        if self.cache:
+            cached = self.cache.get(profile_url)
+            if cached is not None:
+                return cached
+            if self.seen_store is not None and profile_url in self.seen_store:
+                cached = self.cache.get(profile_url, ttl=float("inf"))
+                if cached is not None:
+                    logger.debug("Reusing cached info for seen profile %s", profile_url)
+                    return cached
         info: Dict[str, Optional[str]] = {
             "name": None,
             "headline": None,
             "location": None,
         }
-        try:
-            info["name"] = self.driver.find_element(By.TAG_NAME, "h1").text
-        except Exception:  # noqa: BLE001
-            logger.debug("Name element not found")
-        try:
-            headline = self.driver.find_element(By.CSS_SELECTOR, "div.text-body-medium")
-            info["headline"] = headline.text
-        except Exception:  # noqa: BLE001
-            logger.debug("Headline element not found")
-        try:
-            loc_elem = self.driver.find_element(By.CSS_SELECTOR, "span.text-body-small")
-            info["location"] = loc_elem.text
-        except Exception:  # noqa: BLE001
-            logger.debug("Location element not found")
-        self._results_count += 1
-        self._check_rotation()
+        self.rate_limiter.acquire()
+        logger.debug("Fetching profile %s", profile_url)
+        with self.pool.lease(domain=LINKEDIN_DOMAIN) as driver:
+            driver.get(profile_url)
+            human_scroll(driver)
+            try:
+                data = driver.execute_script(_PROFILE_INFO_JS) or {}
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("Profile extraction script failed: %s", exc)
+                data = {}
+            if _is_throttled(data.pop("title", None)):
+                self.rate_limiter.penalize()
+                return info
+            info.update(data)
+        if info["name"]:
+            if self.cache:
+                self.cache.put(profile_url, info)
+            if self.seen_store is not None:
+                self.seen_store.add(profile_url)
         return info
 
     def verify_profile(self, profile_url: str, expected_name: str) -> Dict[str, Any]:
@@ -2,36 +2,82 @@
 
 from __future__ import annotations
 
+import functools
 import logging
-from typing import Any, Dict, List
-
-import tweepy
+from typing import Any, Dict, Iterable, List, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of users per bulk lookup request allowed by the API.
+BULK_LOOKUP_SIZE = 100
+
 class TwitterFinder:
     """Basic Twitter API wrapper for finding profiles."""
 
     def __init__(self, api_key: str, api_secret: str | None = None, bearer_token: str | None = None) -> None:
+        import tweepy
+
         if bearer_token:
             self.client = tweepy.Client(bearer_token)
         else:
             auth = tweepy.OAuth1UserHandler(api_key, api_secret)
             self.client = tweepy.API(auth)
+        self._search_users = functools.lru_cache(maxsize=8192)(self._search_users_uncached)
 
     def find_profile(self, query: str, **kwargs: Any) -> List[Dict[str, Any]]:
-        """Search for profiles matching the query."""
+        """Search for profiles matching the query.
+
+        Results are memoized per finder; call :meth:`clear_cache` to start a
+        fresh analysis.
+        """
+        import tweepy
+
         try:
-            logger.debug("Searching Twitter for %s", query)
-            if hasattr(self.client, "search_users"):
-                users = self.client.search_users(q=query)
-            else:
-                response = self.client.search_users(query)
-                users = response.data if response else []
-            results = []
-            for user in users:
-                results.append({"username": getattr(user, "screen_name", None) or user.username, "id": user.id})
-            return results
+            users = self._search_users(query)
         except tweepy.TweepyException as exc:
             logger.error("Twitter API error: %s", exc)
             return []
+        return [{"username": username, "id": user_id} for username, user_id in users]
+
+    def clear_cache(self) -> None:
+        """Forget memoized search results."""
+        self._search_users.cache_clear()
+
+    def _search_users_uncached(self, query: str) -> Tuple[Tuple[str, int], ...]:
+        logger.debug("Searching Twitter for %s", query)
+        if hasattr(self.client, "search_users"):
+            users = self.client.search_users(q=query)
+        else:
+            response = self.client.search_users(query)
+            users = response.data if response else []
+        return tuple((getattr(user, "screen_name", None) or user.username, user.id) for user in users)
+
+    def find_profiles_bulk(self, handles: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Look up many handles with one API request per 100 users.
+
+        Returns a mapping of each requested handle to its profile; handles
+        that do not exist are omitted.
+        """
+        import tweepy
+
+        wanted = {h.lstrip("@").lower(): h for h in handles if h.lstrip("@")}
+        names = list(wanted)
+        results: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(names), BULK_LOOKUP_SIZE):
+            chunk = names[start : start + BULK_LOOKUP_SIZE]
+            try:
+                logger.debug("Looking up %d Twitter users", len(chunk))
+                if hasattr(self.client, "lookup_users"):
+                    users = self.client.lookup_users(screen_name=chunk)
+                else:
+                    response = self.client.get_users(usernames=chunk)
+                    users = response.data if response and response.data else []
+            except tweepy.TweepyException as exc:
+                logger.error("Twitter API error: %s", exc)
+                continue
+            for user in users:
+                username = getattr(user, "screen_name", None) or user.username
+                handle = wanted.get(username.lower())
+                if handle is not None:
+                    results[handle] = {"username": username, "id": user.id}
+        return results
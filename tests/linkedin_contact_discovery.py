@@ -4,16 +4,27 @@ from __future__ import annotations
 
 import argparse
 import csv
+import functools
 import json
 import logging
+import os
 import sys
+import threading
+import time
+import weakref
+from concurrent.futures import as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, TextIO
+from urllib.parse import urlparse
 
 from platforms.linkedin import LinkedInFinder
-from utils.rate_limiting import SessionRotator, linkedin_delay
+from utils.driver_pool import POOL_SIZE, close_pool, get_pool
+from utils.linkedin_cache import DEFAULT_TTL, LinkedInCache, SeenProfileStore
+from utils.organization_processor import normalize_name
+from utils.rate_limiting import RateLimitedExecutor, RateLimitTimeoutError
 
 
 logging.basicConfig(
@@ -30,6 +41,22 @@ TARGET_TITLES = [
     "Executive Director",
 ]
 
+_TITLE_FIRST_TOKENS = frozenset(t.split()[0].lower() for t in TARGET_TITLES)
+
+# Common corporate address formats, most likely first.
+EMAIL_PATTERNS = (
+    "{first}.{last}@{domain}",
+    "{f}{last}@{domain}",
+    "{first}_{last}@{domain}",
+    "{first}@{domain}",
+    "{last}{f}@{domain}",
+)
+
+# Results and checkpoint entries are flushed once this many organizations
+# are pending or this many seconds have passed.
+FLUSH_EVERY = 16
+FLUSH_INTERVAL = 30.0
+
 
 @dataclass
 class ExecutiveResult:
@@ -43,14 +70,30 @@ class ExecutiveResult:
     timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
 
 
+# Company pages found so far, per finder and keyed by normalized name. Weak
+# keys let finished finders (and their drivers) be collected.
+_company_pages: "weakref.WeakKeyDictionary[LinkedInFinder, Dict[str, str]]" = (
+    weakref.WeakKeyDictionary()
+)
+_company_pages_lock = threading.Lock()
+
+
 def discover_linkedin_company(finder: LinkedInFinder, org_name: str) -> Optional[str]:
-    """Discover the LinkedIn company page for the organization."""
+    """Discover the LinkedIn company page for the organization.
+
+    Found pages are remembered for the finder's lifetime; failed searches are
+    retried on the next call.
+    """
+    key = normalize_name(org_name)
+    with _company_pages_lock:
+        pages = _company_pages.setdefault(finder, {})
+    url = pages.get(key)
+    if url is not None:
+        return url
     logger.info("Searching LinkedIn for company %s", org_name)
-    linkedin_delay(120, 180)
-    results = finder.search_profiles(org_name)
-    for result in results:
-        url = result.get("url")
-        if url and "/company/" in url:
+    for result in finder.search_profiles(org_name, include_companies=True):
+        if result.get("kind") == "company":
+            url = pages[key] = result["url"]
             logger.info("Found company page: %s", url)
             return url
     logger.warning("No LinkedIn company page found for %s", org_name)
@@ -62,16 +105,15 @@ def find_target_executives(
 ) -> List[Dict[str, str]]:
     """Locate executives that match desired titles."""
     logger.info("Finding executives on %s", company_url)
-    linkedin_delay(120, 180)
     # Placeholder implementation: this would navigate the company page
-    # and extract profiles matching the titles. For now we return an empty list.
+    # (pacing through finder.rate_limiter) and extract profiles matching the
+    # titles. For now we return an empty list.
     return []
 
 
 def extract_contact_info(finder: LinkedInFinder, profile_url: str) -> Dict[str, str]:
     """Extract public contact info from a profile."""
     logger.info("Extracting info from %s", profile_url)
-    linkedin_delay(120, 180)
     info = finder.extract_public_info(profile_url)
     return {
         "name": info.get("name") or "",
@@ -79,20 +121,36 @@ def extract_contact_info(finder: LinkedInFinder, profile_url: str) -> Dict[str,
     }
 
 
+@functools.lru_cache(maxsize=8192)
+def _domain_of(website: str | None) -> str:
+    """Return the host name of ``website``, ignoring scheme, port and path."""
+    if not website:
+        return "example.com"
+    if "//" not in website:
+        website = f"//{website}"
+    return urlparse(website).hostname or "example.com"
+
+
 def predict_email_format(org_name: str, exec_name: str, website: str | None) -> List[str]:
     """Generate possible email addresses based on common patterns."""
     logger.info("Predicting email for %s at %s", exec_name, org_name)
-    if not website:
-        domain = "example.com"
-    else:
-        domain = website.split("//")[-1].split("/")[0]
-    first, *rest = exec_name.split()
-    last = rest[-1] if rest else ""
-    emails = [
-        f"{first.lower()}.{last.lower()}@{domain}",
-        f"{first[0].lower()}{last.lower()}@{domain}",
-    ]
-    return emails
+    if not exec_name.strip():
+        return []
+    domain = _domain_of(website)
+    first, *rest = exec_name.lower().split()
+    if not rest:
+        return [f"{first}@{domain}"]
+    ctx = {"first": first, "last": rest[-1], "f": first[0], "domain": domain}
+    return [pattern.format_map(ctx) for pattern in EMAIL_PATTERNS]
+
+
+def predict_email_formats(website: str) -> List[str]:
+    """Return the likely address formats at ``website``'s domain.
+
+    Name placeholders are left in, e.g. ``{first}.{last}@example.org``.
+    """
+    domain = _domain_of(website)
+    return [pattern.replace("{domain}", domain) for pattern in EMAIL_PATTERNS]
 
 
 def calculate_confidence_score(result: ExecutiveResult) -> int:
@@ -102,17 +160,46 @@ def calculate_confidence_score(result: ExecutiveResult) -> int:
         score += 20
     if result.emails:
         score += 20
-    if any(result.exec_name.lower().startswith(t.split()[0].lower()) for t in TARGET_TITLES):
+    name_tokens = result.exec_name.split()
+    if name_tokens and name_tokens[0].lower() in _TITLE_FIRST_TOKENS:
         score += 10
     return min(score, 100)
 
 
-def process_organization(finder: LinkedInFinder, org: Dict[str, str]) -> List[ExecutiveResult]:
-    """Process a single organization and return discovered executives."""
+def process_organization(
+    finder: LinkedInFinder,
+    org: Dict[str, str],
+    *,
+    target_titles: Iterable[str] = TARGET_TITLES,
+    email_only: bool = False,
+) -> List[ExecutiveResult]:
+    """Process a single organization and return discovered executives.
+
+    :func:`find_target_executives` is still a placeholder, so the LinkedIn
+    company search cannot yield executives yet. When the website is known the
+    search is skipped and a single row with the organization's likely email
+    formats is returned instead. Without a website, LinkedIn is only searched
+    when there are titles to look for and ``email_only`` is off.
+    """
     org_name = org.get("name") or "Unknown"
     website = org.get("website")
+    target_titles = list(target_titles)
+    if website:
+        logger.info("Skipping LinkedIn lookups for %s; website is known", org_name)
+        result = ExecutiveResult(
+            org_name=org_name,
+            exec_name="",
+            title="",
+            emails=predict_email_formats(website),
+            method="email_format",
+        )
+        result.confidence = calculate_confidence_score(result)
+        return [result]
+    if email_only or not target_titles:
+        logger.info("Skipping LinkedIn lookups for %s", org_name)
+        return []
     company_url = discover_linkedin_company(finder, org_name)
-    execs = find_target_executives(finder, company_url, TARGET_TITLES) if company_url else []
+    execs = find_target_executives(finder, company_url, target_titles) if company_url else []
     results: List[ExecutiveResult] = []
     for exec_info in execs:
         profile_url = exec_info.get("url")
@@ -134,47 +221,153 @@ def process_organization(finder: LinkedInFinder, org: Dict[str, str]) -> List[Ex
 
 
 def load_checkpoint(path: Path) -> Dict[str, List[dict]]:
-    if path.exists():
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f)
-    return {}
-
-
-def save_checkpoint(path: Path, data: Dict[str, List[dict]]) -> None:
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
-
-
-def write_results(path: Path, results: List[ExecutiveResult]) -> None:
-    file_exists = path.exists()
-    with path.open("a", newline="", encoding="utf-8") as csvfile:
-        writer = csv.writer(csvfile)
-        if not file_exists:
-            writer.writerow(
-                [
-                    "org_name",
-                    "exec_name",
-                    "title",
-                    "linkedin_url",
-                    "emails",
-                    "confidence",
-                    "method",
-                    "timestamp",
-                ]
-            )
-        for res in results:
-            writer.writerow(
-                [
-                    res.org_name,
-                    res.exec_name,
-                    res.title,
-                    res.linkedin_url or "",
-                    ";".join(res.emails),
-                    res.confidence,
-                    res.method,
-                    res.timestamp,
-                ]
-            )
+    """Replay the JSON-lines checkpoint log; later entries win.
+
+    Checkpoints written before the log format were one indented JSON dict,
+    possibly with log lines appended since. Those, and logs ending in a line
+    torn by a crash, are rewritten as a clean log so later appends stay
+    readable.
+    """
+    data: Dict[str, List[dict]] = {}
+    if not path.exists():
+        return data
+    with path.open("r", encoding="utf-8") as f:
+        head = f.readline()
+        if head.rstrip() == "{":
+            text = head + f.read()
+            data, end = json.JSONDecoder().raw_decode(text)
+            lines: Iterable[str] = text[end:].splitlines()
+            rewrite = True
+        else:
+            lines = chain((head,), f)
+            rewrite = False
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                data.update(json.loads(line))
+            except (TypeError, ValueError):
+                # A crash mid-append leaves a torn final line.
+                logger.warning("Skipping unreadable checkpoint entry in %s", path)
+                rewrite = True
+    if rewrite:
+        _rewrite_checkpoint(path, data)
+    return data
+
+
+def _rewrite_checkpoint(path: Path, data: Dict[str, List[dict]]) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.unlink(missing_ok=True)
+    append_checkpoint(tmp, data, sync=True)
+    os.replace(tmp, path)
+
+
+def append_checkpoint(
+    path: Path, entries: Dict[str, List[dict]], *, sync: bool = False
+) -> None:
+    """Append one JSON line per organization to the checkpoint log."""
+    with path.open("a", encoding="utf-8") as f:
+        for org_name, results in entries.items():
+            f.write(json.dumps({org_name: results}) + "\n")
+        if sync:
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class CSVWriter:
+    """Append executive results to a CSV file kept open for the whole run."""
+
+    HEADER = [
+        "org_name",
+        "exec_name",
+        "title",
+        "linkedin_url",
+        "emails",
+        "confidence",
+        "method",
+        "timestamp",
+    ]
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._file: Optional[TextIO] = None
+        self._writer: Any = None
+
+    def __enter__(self) -> "CSVWriter":
+        self._file = self.path.open("a", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        if self._file.tell() == 0:
+            self._writer.writerow(self.HEADER)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def write(self, results: List[ExecutiveResult]) -> None:
+        self._writer.writerows(
+            [
+                res.org_name,
+                res.exec_name,
+                res.title,
+                res.linkedin_url or "",
+                ";".join(res.emails),
+                res.confidence,
+                res.method,
+                res.timestamp,
+            ]
+            for res in results
+        )
+
+    def flush(self) -> None:
+        if self._file:
+            self._file.flush()
+
+
+class FlushScheduler:
+    """Buffer results and checkpoint entries, flushing them together.
+
+    A flush happens once ``max_pending`` organizations are buffered or
+    ``max_age`` seconds have passed since the last one. CSV rows are written
+    before the checkpoint so a checkpointed organization always has its rows
+    on disk.
+    """
+
+    def __init__(
+        self,
+        writer: CSVWriter,
+        checkpoint_path: Path,
+        *,
+        max_pending: int = FLUSH_EVERY,
+        max_age: float = FLUSH_INTERVAL,
+    ) -> None:
+        self.writer = writer
+        self.checkpoint_path = checkpoint_path
+        self.max_pending = max_pending
+        self.max_age = max_age
+        self._rows: List[ExecutiveResult] = []
+        self._entries: Dict[str, List[dict]] = {}
+        self._last_flush = time.monotonic()
+
+    def add(self, org_name: str, results: List[ExecutiveResult]) -> None:
+        self._rows.extend(results)
+        self._entries[org_name] = [res.__dict__ for res in results]
+        if (
+            len(self._entries) >= self.max_pending
+            or time.monotonic() - self._last_flush >= self.max_age
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        if self._entries:
+            self.writer.write(self._rows)
+            self.writer.flush()
+            append_checkpoint(self.checkpoint_path, self._entries, sync=True)
+            self._rows.clear()
+            self._entries.clear()
+        self._last_flush = time.monotonic()
 
 
 def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
@@ -182,7 +375,37 @@ def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
     parser.add_argument("--input", required=True, help="Input CSV of organizations")
     parser.add_argument("--output", required=True, help="Output CSV for executives")
     parser.add_argument("--limit", type=int, default=20, help="Limit number of organizations")
-    parser.add_argument("--checkpoint-file", required=True, help="Checkpoint JSON file")
+    parser.add_argument("--checkpoint-file", required=True, help="Checkpoint JSON-lines file")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=POOL_SIZE,
+        help="Number of browsers processing organizations in parallel",
+    )
+    parser.add_argument(
+        "--max-delay",
+        type=float,
+        default=3600.0,
+        help="Seconds an organization may wait on rate limiting before it is deferred",
+    )
+    parser.add_argument(
+        "--email-only",
+        action="store_true",
+        help=(
+            "Never search LinkedIn; organizations without a website get no "
+            "email format predictions"
+        ),
+    )
+    parser.add_argument("--cache-file", help="SQLite cache of scraped LinkedIn pages")
+    parser.add_argument(
+        "--seen-file", help="SQLite set of profiles already scraped in earlier runs"
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=DEFAULT_TTL,
+        help="Seconds before cached LinkedIn pages are scraped again",
+    )
     return parser.parse_args(argv)
 
 
@@ -193,27 +416,65 @@ def main(argv: List[str] | None = None) -> int:
     checkpoint_path = Path(args.checkpoint_file)
     checkpoint = load_checkpoint(checkpoint_path)
 
-    finder = LinkedInFinder(headless=True, session_rotation=10)
-    rotator = SessionRotator(rotate_every=10)
-
+    pending: List[Dict[str, str]] = []
     with input_path.open("r", newline="", encoding="utf-8") as csvfile:
-        reader = csv.DictReader(csvfile)
-        count = 0
+        reader = csv.reader(csvfile)
+        header = next(reader, None)
+        if header is None:
+            logger.info("No organizations in %s", input_path)
+            return 0
+        if "name" not in header:
+            logger.error("No 'name' column in %s", input_path)
+            return 1
+        name_idx = header.index("name")
+        website_idx = header.index("website") if "website" in header else None
         for row in reader:
-            org_name = row.get("name") or ""
+            if len(row) <= name_idx:
+                continue
+            org_name = row[name_idx]
             if org_name in checkpoint:
                 logger.info("Skipping %s (already processed)", org_name)
                 continue
-            results = process_organization(finder, row)
-            write_results(output_path, results)
-            checkpoint[org_name] = [res.__dict__ for res in results]
-            save_checkpoint(checkpoint_path, checkpoint)
-            count += 1
-            if rotator.increment():
-                finder._rotate_session()
-            if count >= args.limit:
+            website = row[website_idx] if website_idx is not None and website_idx < len(row) else ""
+            pending.append({"name": org_name, "website": website})
+            if len(pending) >= args.limit:
                 break
-    finder.close()
+
+    pool = get_pool(size=args.workers, headless=True, max_uses=10)
+    cache = LinkedInCache(args.cache_file, ttl=args.cache_ttl) if args.cache_file else None
+    seen = SeenProfileStore(args.seen_file) if args.seen_file else None
+    finder = LinkedInFinder(pool=pool, cache=cache, seen_store=seen)
+    try:
+        with CSVWriter(output_path) as writer, RateLimitedExecutor(
+            args.workers, max_delay=args.max_delay
+        ) as executor:
+            futures = {
+                executor.submit(
+                    process_organization, finder, row, email_only=args.email_only
+                ): row.get("name") or ""
+                for row in pending
+            }
+            scheduler = FlushScheduler(writer, checkpoint_path)
+            try:
+                for future in as_completed(futures):
+                    org_name = futures[future]
+                    try:
+                        results = future.result()
+                    except RateLimitTimeoutError as exc:
+                        logger.warning("Deferring %s to a later run: %s", org_name, exc)
+                        continue
+                    except Exception as exc:  # noqa: BLE001
+                        logger.error("Failed to process %s: %s", org_name, exc)
+                        continue
+                    scheduler.add(org_name, results)
+            finally:
+                scheduler.flush()
+    finally:
+        close_pool()
+        if cache:
+            cache.close()
+        if seen:
+            seen.close()
     return 0
 
 
@@ -0,0 +1,48 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from utils.caching import BlobCache
+
+
+class TestBlobCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmpdir.name) / "blobs"
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def test_persists_and_bounds_memory(self) -> None:
+        cache = BlobCache(self.path, memory_items=2)
+        for i in range(4):
+            cache.put(f"k{i}", bytes([i]) * 10)
+        self.assertEqual(len(cache._memory), 2)
+        self.assertEqual(cache.get("k0"), b"\x00" * 10)
+        cache.close()
+        reopened = BlobCache(self.path)
+        self.assertEqual(reopened.get("k3"), b"\x03" * 10)
+        self.assertIsNone(reopened.get("missing"))
+        reopened.close()
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = BlobCache(self.path, size_limit=25, memory_items=0)
+        cache.put("a", b"a" * 10)
+        cache.put("b", b"b" * 10)
+        cache.get("a")
+        cache.put("c", b"c" * 10)
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIn("c", cache)
+        cache.close()
+
+    def test_memory_only_entries_are_not_written(self) -> None:
+        cache = BlobCache(self.path)
+        cache.put("local", b"data", persist=False)
+        self.assertEqual(cache.get("local"), b"data")
+        self.assertFalse(self.path.exists())
+        cache.close()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
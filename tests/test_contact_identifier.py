@@ -2,6 +2,7 @@ import unittest
 from datetime import datetime, timedelta
 
 from utils import ContactIdentifier
+from utils.contact_identifier import matching_lines, role_pattern
 
 
 class TestContactIdentifier(unittest.TestCase):
@@ -30,6 +31,16 @@ class TestContactIdentifier(unittest.TestCase):
         self.assertEqual(matched[0].role, "CFO")
         self.assertGreater(matched[0].score, 0.5)
 
+    def test_fuzzy_title_match(self) -> None:
+        self.assertEqual(self.identifier._title_score("Generl Counsel", "General Counsel"), 0.6)
+        self.assertEqual(self.identifier._title_score("Head Chef", "General Counsel"), 0.0)
+
+    def test_matching_lines(self) -> None:
+        lines = ["Jane Doe", "CFO and General Counsel", "jane@example.com", "cfo"]
+        pattern = role_pattern(["CFO", "General Counsel"])
+        self.assertEqual(matching_lines(lines, pattern), [1, 3])
+        self.assertEqual(matching_lines([], pattern), [])
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
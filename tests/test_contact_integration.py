@@ -1,3 +1,4 @@
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -7,6 +8,7 @@ from utils import (
     WebsiteScraper,
     PublicFilingsFinder,
 )
+from utils.contact_integration import HEADERS
 
 
 class StubWebsiteScraper(WebsiteScraper):
@@ -78,6 +80,51 @@ class TestContactIntegration(unittest.TestCase):
         self.assertEqual(rec.email, "alice@example.com")
         self.assertGreater(rec.confidence, 0.9)
 
+    def test_checkpoint_wal_resume(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            checkpoint = Path(tmp) / "checkpoint.json"
+
+            def make(compact_every: int) -> ContactIntegration:
+                return ContactIntegration(
+                    csv_processor=load_processor(),
+                    website_scraper=StubWebsiteScraper(),
+                    filings_finder=StubFilingsFinder(),
+                    linkedin_finder=StubLinkedInFinder(),
+                    checkpoint_file=str(checkpoint),
+                    checkpoint_compact_every=compact_every,
+                )
+
+            first = make(compact_every=1000)
+            expected = first.discover_contacts(target_roles=["General Counsel"], min_confidence=0)
+            self.assertFalse(checkpoint.exists())
+            self.assertTrue(checkpoint.with_suffix(".wal").stat().st_size > 0)
+
+            resumed = make(compact_every=1)
+            self.assertEqual(resumed._processed, first._processed)
+            self.assertEqual(
+                [(r.name, r.confidence, r.sources) for r in resumed.results],
+                [(r.name, r.confidence, r.sources) for r in expected],
+            )
+            resumed._save_checkpoint()
+            self.assertTrue(checkpoint.exists())
+            self.assertEqual(checkpoint.with_suffix(".wal").stat().st_size, 0)
+            again = make(compact_every=1)
+            self.assertEqual(
+                [(r.name, r.confidence) for r in again.results],
+                [(r.name, r.confidence) for r in expected],
+            )
+
+    def test_export_csv_quotes_only_when_needed(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "contacts.csv"
+            ContactIntegration._export_csv(
+                path, [(1, "Fund, Inc.", "Alice", "GC", "", "", 0.95, "website;filing")]
+            )
+            self.assertEqual(
+                path.read_text(encoding="utf-8").splitlines(),
+                [",".join(HEADERS), '1,"Fund, Inc.",Alice,GC,,,0.95,website;filing'],
+            )
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
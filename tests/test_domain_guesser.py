@@ -1,3 +1,4 @@
+import time
 import unittest
 
 from utils.domain_guesser import DomainGuesser
@@ -12,6 +13,21 @@ class TestDomainGuesser(unittest.TestCase):
         self.assertIn("examplefund.com", cands)
         self.assertIn("examplefund.org", cands)
 
+    def test_guess_keeps_tld_order(self) -> None:
+        def exists(domain: str) -> bool:
+            if domain.endswith(".org"):
+                time.sleep(0.05)
+            return not domain.endswith(".com")
+
+        self.guesser._domain_exists = exists
+        self.assertEqual(self.guesser.guess("Example Fund"), "examplefund.org")
+
+    def test_domain_exists_requires_resolution(self) -> None:
+        self.guesser.session = None
+        self.guesser._resolves = lambda domain: domain == "examplefund.org"
+        self.assertTrue(self.guesser._domain_exists("examplefund.org"))
+        self.assertFalse(self.guesser._domain_exists("examplefund.com"))
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+from unittest import mock
+
+from utils import driver_pool
+from utils.driver_pool import StealthDriverPool
+
+
+class FakeDriver:
+    def delete_all_cookies(self) -> None:
+        pass
+
+    def quit(self) -> None:
+        pass
+
+
+class TestStealthDriverPool(unittest.TestCase):
+    def test_failed_respawn_keeps_slot(self) -> None:
+        launches = [FakeDriver(), RuntimeError("chrome crashed"), FakeDriver()]
+
+        def launch(*, headless: bool) -> FakeDriver:
+            item = launches.pop(0)
+            if isinstance(item, Exception):
+                raise item
+            return item
+
+        with mock.patch.object(driver_pool, "create_stealth_driver", side_effect=launch):
+            pool = StealthDriverPool(size=1, max_uses=1, instance_timeout=0.1)
+            first = pool.acquire()
+            # Served its one use; the replacement launch fails.
+            pool.release(first)
+            second = pool.acquire()
+            self.assertIsInstance(second, FakeDriver)
+            self.assertIsNot(second, first)
+            self.assertEqual(launches, [])
+            pool.close()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -28,6 +28,55 @@ class TestEmailPatternGenerator(unittest.TestCase):
         self.gen.verify_emails(candidates)
         self.assertEqual(calls["mx"], 1)
 
+    def test_mx_resolved_once_per_domain(self) -> None:
+        domains = []
+
+        def fake_mx(domain: str) -> bool:
+            domains.append(domain)
+            return domain == "example.com"
+
+        batches = []
+        self.gen._check_mx = fake_mx
+        self.gen._smtp_check_batch = lambda d, emails: batches.append((d, emails)) or {}
+        candidates = [
+            EmailCandidate("jane.smith@example.com", 0.4),
+            EmailCandidate("jsmith@example.com", 0.3),
+            EmailCandidate("jane@nomail.org", 0.1),
+        ]
+        verified = self.gen.verify_emails(candidates)
+        self.assertEqual(sorted(domains), ["example.com", "nomail.org"])
+        self.assertEqual(batches, [("example.com", ["jane.smith@example.com", "jsmith@example.com"])])
+        self.assertEqual([c.email for c in verified], ["jane.smith@example.com", "jsmith@example.com"])
+
+    def test_invalid_syntax_skips_lookup(self) -> None:
+        domains = []
+        self.gen._check_mx = lambda d: domains.append(d) or True
+        self.gen._smtp_check_batch = lambda d, emails: {}
+        verified = self.gen.verify_emails([EmailCandidate("jane smith@example.com", 0.4)])
+        self.assertEqual(verified, [])
+        self.assertEqual(domains, [])
+
+    def test_failed_smtp_session_is_closed(self) -> None:
+        class BrokenSMTP:
+            quit_calls = 0
+
+            def mail(self, sender: str) -> None:
+                pass
+
+            def rcpt(self, email: str) -> tuple:
+                raise OSError("connection reset")
+
+            def quit(self) -> None:
+                self.quit_calls += 1
+
+        smtp = BrokenSMTP()
+        self.gen._mx_host = lambda d: "mx.example.com"
+        self.gen._smtp_session = lambda host: smtp
+        results = self.gen._smtp_check_batch("example.com", ["jane@example.com"])
+        self.assertEqual(results, {"jane@example.com": False})
+        self.assertEqual(smtp.quit_calls, 1)
+        self.assertNotIn("mx.example.com", self.gen._smtp_pool)
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
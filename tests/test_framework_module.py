@@ -89,6 +89,31 @@ class TestFrameworkBasics(unittest.TestCase):
         self.assertIn("linkedin", rec.sources)
         self.assertEqual(rec.email, "alice@example.com")
 
+    def test_components_parallel_matches_serial(self) -> None:
+        sample = self.framework.create_sample(size=2, random_seed=1)
+        names = ["website_scraper", "filings_finder"]
+        serial = self.framework.test_components(sample=sample, components=names, parallel=False)
+        parallel = self.framework.test_components(sample=sample, components=names)
+        for name in names:
+            self.assertEqual(
+                [[c.name for c in found] for found in parallel[name]],
+                [[c.name for c in found] for found in serial[name]],
+            )
+            self.assertEqual(len(parallel[name]), 2)
+
+    def test_report_escapes_html(self) -> None:
+        sample = self.framework.create_sample(size=1, random_seed=1)
+        components = self.framework.test_components(sample=sample, components=["website_scraper"])
+        pipeline = self.framework.test_pipeline(sample=sample, target_roles=["<b>Counsel</b>"])
+        with tempfile.TemporaryDirectory() as tmp:
+            report = Path(tmp) / "report.html"
+            self.framework.generate_report(
+                component_results=components, pipeline_results=pipeline, output_path=report
+            )
+            text = report.read_text(encoding="utf-8")
+        self.assertIn("&lt;b&gt;Counsel&lt;/b&gt;", text)
+        self.assertNotIn("<b>", text)
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
@@ -0,0 +1,62 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from platforms.linkedin import LinkedInFinder
+from utils.linkedin_cache import LinkedInCache, SeenProfileStore, normalize_url
+
+
+class TestLinkedInCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache = LinkedInCache(Path(self.tmpdir.name) / "cache.sqlite")
+
+    def tearDown(self) -> None:
+        self.cache.close()
+        self.tmpdir.cleanup()
+
+    def test_normalize_url(self) -> None:
+        self.assertEqual(
+            normalize_url("https://www.LinkedIn.com/in/Alice/?trk=abc"),
+            "https://www.linkedin.com/in/alice",
+        )
+
+    def test_roundtrip_and_expiry(self) -> None:
+        info = {"name": "Alice Johnson", "headline": "General Counsel", "location": None}
+        self.cache.put("https://linkedin.com/in/alice/", info)
+        self.assertEqual(self.cache.get("https://linkedin.com/in/alice?x=1"), info)
+        self.assertIsNone(self.cache.get("https://linkedin.com/in/alice", ttl=-1))
+        self.assertIsNone(self.cache.get("https://linkedin.com/in/bob"))
+
+    def test_search_keys_kept_whole(self) -> None:
+        self.cache.put("search:alpha fund?", ["a"], normalize=False)
+        self.cache.put("search:alpha fund", ["b"], normalize=False)
+        self.assertEqual(self.cache.get("search:alpha fund?", normalize=False), ["a"])
+        self.assertEqual(self.cache.get("search:alpha fund", normalize=False), ["b"])
+
+    def test_seen_store(self) -> None:
+        seen = SeenProfileStore(Path(self.tmpdir.name) / "seen.sqlite")
+        self.assertNotIn("https://linkedin.com/in/alice", seen)
+        seen.add("https://linkedin.com/in/Alice/")
+        self.assertIn("https://linkedin.com/in/alice", seen)
+        seen.close()
+
+    def test_seen_profile_is_not_fetched_again(self) -> None:
+        class NoDriverPool:
+            def lease(self, **kwargs: object) -> None:
+                raise AssertionError("seen profile should not be navigated to")
+
+        url = "https://linkedin.com/in/alice"
+        info = {"name": "Alice Johnson", "headline": "General Counsel", "location": None}
+        stale = LinkedInCache(Path(self.tmpdir.name) / "stale.sqlite", ttl=-1)
+        stale.put(url, info)
+        seen = SeenProfileStore(Path(self.tmpdir.name) / "seen.sqlite")
+        seen.add(url)
+        finder = LinkedInFinder(pool=NoDriverPool(), cache=stale, seen_store=seen)
+        self.assertEqual(finder.extract_public_info(url), info)
+        stale.close()
+        seen.close()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,86 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from tests.linkedin_contact_discovery import (
+    append_checkpoint,
+    discover_linkedin_company,
+    load_checkpoint,
+    main,
+    process_organization,
+)
+
+
+class NoSearchFinder:
+    def search_profiles(self, query: str) -> list:
+        raise AssertionError("LinkedIn should not be searched")
+
+
+class CompanyFinder:
+    def __init__(self, responses: list) -> None:
+        self.responses = responses
+        self.queries: list = []
+
+    def search_profiles(self, query: str, *, include_companies: bool = False) -> list:
+        self.queries.append(query)
+        return self.responses.pop(0)
+
+
+class TestCheckpoint(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmpdir.name) / "checkpoint.jsonl"
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def test_legacy_checkpoint_with_appended_entries(self) -> None:
+        self.path.write_text(json.dumps({"Alpha Fund": []}, indent=2), encoding="utf-8")
+        append_checkpoint(self.path, {"Beta Fund": [{"exec_name": "Jane"}]})
+        expected = {"Alpha Fund": [], "Beta Fund": [{"exec_name": "Jane"}]}
+        self.assertEqual(load_checkpoint(self.path), expected)
+        # Rewritten as a log, so further appends keep it readable.
+        append_checkpoint(self.path, {"Gamma Fund": []})
+        self.assertEqual(load_checkpoint(self.path), {**expected, "Gamma Fund": []})
+
+    def test_torn_trailing_line_is_skipped(self) -> None:
+        append_checkpoint(self.path, {"Alpha Fund": []})
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write('{"Beta Fund": [{"exec_')
+        self.assertEqual(load_checkpoint(self.path), {"Alpha Fund": []})
+        append_checkpoint(self.path, {"Gamma Fund": []})
+        self.assertEqual(load_checkpoint(self.path), {"Alpha Fund": [], "Gamma Fund": []})
+
+
+class TestProcessOrganization(unittest.TestCase):
+    def test_known_website_skips_linkedin(self) -> None:
+        org = {"name": "Alpha Fund", "website": "https://www.alphafund.org/about"}
+        (result,) = process_organization(NoSearchFinder(), org)
+        self.assertEqual(result.method, "email_format")
+        self.assertIn("{first}.{last}@www.alphafund.org", result.emails)
+
+
+class TestDiscoverCompany(unittest.TestCase):
+    def test_only_found_pages_are_remembered(self) -> None:
+        page = {"url": "https://www.linkedin.com/company/alpha-fund", "kind": "company"}
+        finder = CompanyFinder([[], [page]])
+        self.assertIsNone(discover_linkedin_company(finder, "Alpha Fund, Inc."))
+        self.assertEqual(discover_linkedin_company(finder, "Alpha Fund, Inc."), page["url"])
+        self.assertEqual(discover_linkedin_company(finder, "alpha fund inc"), page["url"])
+        self.assertEqual(finder.queries, ["Alpha Fund, Inc.", "Alpha Fund, Inc."])
+
+
+class TestMain(unittest.TestCase):
+    def test_input_without_name_column_or_rows(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            base = Path(tmp)
+            argv = ["--output", str(base / "out.csv"), "--checkpoint-file", str(base / "cp.jsonl")]
+            (base / "empty.csv").write_text("", encoding="utf-8")
+            self.assertEqual(main(["--input", str(base / "empty.csv"), *argv]), 0)
+            (base / "bad.csv").write_text("website\nexample.org\n", encoding="utf-8")
+            self.assertEqual(main(["--input", str(base / "bad.csv"), *argv]), 1)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
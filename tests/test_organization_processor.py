@@ -22,6 +22,22 @@ class TestOrganizationProcessor(unittest.TestCase):
         self.assertEqual(len(batch2), 1)
         self.assertEqual(batch2[0].ein, 987654321)
 
+    def test_select_filters_columns(self) -> None:
+        processor = OrganizationProcessor(Path(__file__).with_name("sample_taft_hartley.csv"))
+        every = processor.select()
+        self.assertEqual(len(every), 2)
+        rows = processor.select(eins=[987654321, 1])
+        self.assertEqual([o.ein for o in processor.records(rows)], [987654321])
+        self.assertEqual(processor.select(min_plan_count=1000), [])
+
+    def test_organizations_are_built_once(self) -> None:
+        processor = OrganizationProcessor(Path(__file__).with_name("sample_taft_hartley.csv"))
+        orgs = processor.organizations
+        self.assertIs(processor.organizations, orgs)
+        self.assertIs(processor.get(123456789), orgs[123456789])
+        processor.mark_processed(123456789)
+        self.assertTrue(orgs[123456789].processed)
+
 
 if __name__ == "__main__":
     unittest.main()
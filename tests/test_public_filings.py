@@ -18,6 +18,9 @@ class TestPublicFilingsFinder(unittest.TestCase):
         self.assertEqual(contact.title, "General Counsel")
         self.assertGreater(contact.confidence, 0.5)
 
+    def test_ein_matches_as_string_or_int(self) -> None:
+        self.assertEqual(len(self.finder.find_filings(ein=123456789)), 1)
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+from unittest import mock
+
+from utils.rate_limiting import (
+    RateLimitedExecutor,
+    RateLimitTimeoutError,
+    TokenBucket,
+    exponential_backoff,
+)
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_wait(self) -> None:
+        bucket = TokenBucket(rate=1.0, capacity=2)
+        with mock.patch("utils.rate_limiting.time.sleep") as sleep:
+            self.assertEqual(bucket.acquire(), 0.0)
+            self.assertEqual(bucket.acquire(), 0.0)
+            sleep.assert_not_called()
+            self.assertGreater(bucket.acquire(), 0.5)
+            sleep.assert_called_once()
+
+    def test_penalize_slows_refill(self) -> None:
+        bucket = TokenBucket(rate=1.0, capacity=1)
+        bucket.penalize()
+        with mock.patch("utils.rate_limiting.time.sleep"):
+            self.assertGreater(bucket.acquire(), 1.5)
+
+
+class TestExponentialBackoff(unittest.TestCase):
+    def test_retries_then_reraises(self) -> None:
+        calls = []
+
+        @exponential_backoff(retries=3, base_delay=0.0)
+        def flaky() -> str:
+            calls.append(1)
+            raise ConnectionError("down")
+
+        with mock.patch("utils.rate_limiting.time.sleep") as sleep:
+            with self.assertRaises(ConnectionError):
+                flaky()
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(sleep.call_count, 2)
+
+    def test_other_errors_not_retried(self) -> None:
+        calls = []
+
+        @exponential_backoff(retries=3)
+        def broken() -> None:
+            calls.append(1)
+            raise KeyError("bug")
+
+        with self.assertRaises(KeyError):
+            broken()
+        self.assertEqual(len(calls), 1)
+
+
+class TestRateLimitedExecutor(unittest.TestCase):
+    def test_deadlines(self) -> None:
+        bucket = TokenBucket(rate=0.01, capacity=1)
+        with RateLimitedExecutor(1) as executor:
+            ok = executor.submit(bucket.acquire)
+            expired = executor.submit(bucket.acquire, deadline=0.0)
+            self.assertEqual(ok.result(), 0.0)
+            with self.assertRaises(RateLimitTimeoutError):
+                expired.result()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
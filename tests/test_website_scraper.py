@@ -1,4 +1,7 @@
+import tempfile
 import unittest
+from pathlib import Path
+from unittest import mock
 
 from utils.website_scraper import WebsiteScraper, OrgRecord
 
@@ -29,6 +32,75 @@ class TestWebsiteScraper(unittest.TestCase):
         self.assertEqual(execs[0].title, "General Counsel")
         self.assertEqual(execs[1].email, "john@example.com")
 
+    def test_sitemap_guides_leadership_search(self) -> None:
+        pages = {
+            "https://trust.org/sitemap.xml": (
+                '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+                "<url><loc>https://trust.org/news</loc></url>"
+                "<url><loc>https://trust.org/our-team/</loc></url>"
+                "<url><loc>https://other.org/team</loc></url>"
+                "</urlset>"
+            ),
+            "https://trust.org/our-team/": "<h1>Our Team</h1>",
+        }
+        with mock.patch.object(
+            self.scraper, "_stream", side_effect=lambda u: iter([pages.get(u, "")])
+        ) as stream:
+            url, _ = self.scraper.find_leadership_page("https://trust.org/")
+        self.assertEqual(url, "https://trust.org/our-team/")
+        self.assertEqual(stream.call_count, 2)
+
+    def test_sitemap_with_dtd_is_ignored(self) -> None:
+        sitemap = (
+            '<?xml version="1.0"?><!DOCTYPE urlset [<!ENTITY a "team">]>'
+            "<urlset><url><loc>https://trust.org/our-&a;/</loc></url></urlset>"
+        )
+        with mock.patch.object(self.scraper, "_stream", return_value=iter([sitemap])):
+            self.assertEqual(self.scraper._sitemap_urls("https://trust.org/"), [])
+
+    def test_fetch_matching_across_chunks(self) -> None:
+        chunks = ["<html><body><h2 class='x'>Our Lead", "ership</h2><div data-team", "='1'>Hi</div>"]
+        with mock.patch.object(self.scraper, "_stream", return_value=iter(chunks)):
+            html, found = self.scraper.fetch_matching("https://trust.org/a", ["leadership"])
+        self.assertTrue(found)
+        self.assertEqual(html, "".join(chunks))
+        with mock.patch.object(self.scraper, "_stream", return_value=iter(chunks[1:])):
+            _, found = self.scraper.fetch_matching("https://trust.org/a", ["team"])
+        self.assertFalse(found)
+        with mock.patch.object(self.scraper, "_stream", return_value=iter(chunks)):
+            html, found = self.scraper.fetch_matching("https://trust.org/a", [])
+        self.assertEqual((html, found), ("".join(chunks), False))
+
+    def test_fetch_served_from_page_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            scraper = WebsiteScraper(rate_limit=0, cache_dir=Path(tmp) / "pages")
+            scraper._page_cache.put("https://trust.org/team", "<h1>Team</h1>".encode("utf-8"))
+            with mock.patch.object(scraper, "_allowed", return_value=True), mock.patch.object(
+                scraper, "_sleep_if_needed"
+            ) as sleep:
+                self.assertEqual(scraper.fetch("https://trust.org/team"), "<h1>Team</h1>")
+                sleep.assert_not_called()
+            with mock.patch.object(scraper, "_allowed", return_value=False):
+                self.assertEqual(scraper.fetch("https://trust.org/team"), "")
+            scraper._page_cache.close()
+
+    def test_derive_website_remembers_results(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = Path(tmp) / "websites.sqlite"
+            scraper = WebsiteScraper(rate_limit=0, website_cache=cache)
+            with mock.patch.object(
+                scraper, "_search_website", return_value="https://trust-a.org"
+            ) as search:
+                self.assertEqual(scraper.derive_website("Trust A, Inc."), "https://trust-a.org")
+                self.assertEqual(scraper.derive_website("trust a inc"), "https://trust-a.org")
+                search.assert_called_once()
+            rerun = WebsiteScraper(rate_limit=0, website_cache=cache)
+            with mock.patch.object(rerun, "_search_website") as search:
+                self.assertEqual(rerun.derive_website("Trust A, Inc."), "https://trust-a.org")
+                search.assert_not_called()
+            scraper._website_cache.close()
+            rerun._website_cache.close()
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
@@ -1,13 +1,36 @@
-"""Utility package for social media finder."""
+"""Utility package for social media finder.
 
-from .organization_processor import OrganizationProcessor, Organization, normalize_name
-from .website_scraper import WebsiteScraper, OrgRecord, Executive
-from .public_filings import PublicFilingsFinder, Filing, ContactInfo
-from .contact_identifier import ContactIdentifier, MatchedContact, Contact
-from .contact_integration import ContactIntegration, ContactRecord
-from .email_patterns import EmailPatternGenerator, EmailCandidate
-from .domain_guesser import DomainGuesser
-from .test_framework import TestFramework, Sample
+Public names are re-exported lazily (PEP 562): a submodule is only imported
+the first time one of its names is accessed, so importing a single helper
+does not pull in every scraper and its dependencies.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any, Dict, List, Tuple
+
+_LAZY: Dict[str, Tuple[str, str]] = {
+    "OrganizationProcessor": (".organization_processor", "OrganizationProcessor"),
+    "Organization": (".organization_processor", "Organization"),
+    "normalize_name": (".organization_processor", "normalize_name"),
+    "WebsiteScraper": (".website_scraper", "WebsiteScraper"),
+    "OrgRecord": (".website_scraper", "OrgRecord"),
+    "Executive": (".website_scraper", "Executive"),
+    "PublicFilingsFinder": (".public_filings", "PublicFilingsFinder"),
+    "Filing": (".public_filings", "Filing"),
+    "ContactInfo": (".public_filings", "ContactInfo"),
+    "ContactIdentifier": (".contact_identifier", "ContactIdentifier"),
+    "MatchedContact": (".contact_identifier", "MatchedContact"),
+    "Contact": (".contact_identifier", "Contact"),
+    "ContactIntegration": (".contact_integration", "ContactIntegration"),
+    "ContactRecord": (".contact_integration", "ContactRecord"),
+    "EmailPatternGenerator": (".email_patterns", "EmailPatternGenerator"),
+    "EmailCandidate": (".email_patterns", "EmailCandidate"),
+    "DomainGuesser": (".domain_guesser", "DomainGuesser"),
+    "TestFramework": (".test_framework", "TestFramework"),
+    "Sample": (".test_framework", "Sample"),
+}
 
 __all__ = [
     "OrganizationProcessor",
@@ -31,3 +54,16 @@ __all__ = [
     "Sample",
 ]
 
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -4,11 +4,10 @@ from __future__ import annotations
 
 import logging
 import random
-import time
-from typing import Sequence
+from typing import TYPE_CHECKING, Sequence
 
-import undetected_chromedriver as uc
-from selenium.webdriver import ChromeOptions, Chrome
+if TYPE_CHECKING:  # pragma: no cover - imported lazily at runtime
+    from selenium.webdriver import Chrome
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +22,9 @@ USER_AGENTS: Sequence[str] = [
 
 def create_stealth_driver(*, headless: bool = True) -> Chrome:
     """Create a Chrome driver instance with basic fingerprint randomization."""
+    import undetected_chromedriver as uc
+    from selenium.webdriver import ChromeOptions
+
     options = ChromeOptions()
     ua = random.choice(USER_AGENTS)
     options.add_argument(f"--user-agent={ua}")
@@ -34,15 +36,41 @@ def create_stealth_driver(*, headless: bool = True) -> Chrome:
     return driver
 
 
-def human_scroll(driver: Chrome, *, min_pause: float = 0.3, max_pause: float = 0.8) -> None:
-    """Simulate human-like scrolling behavior."""
-    scroll_height = driver.execute_script("return document.body.scrollHeight")
-    current_height = 0
-    while current_height < scroll_height:
-        step = random.randint(200, 400)
-        current_height += step
-        driver.execute_script(f"window.scrollTo(0, {current_height});")
-        time.sleep(random.uniform(min_pause, max_pause))
+# Scrolls to the bottom of the page in random 200-400px steps with a random
+# pause between steps, then calls the async-script callback.
+_HUMAN_SCROLL_JS = """
+const [minPause, maxPause, maxDuration, done] = arguments;
+const target = document.body.scrollHeight;
+const deadline = Date.now() + maxDuration;
+let y = 0;
+(function step() {
+  if (y >= target || Date.now() >= deadline) { done(); return; }
+  y += 200 + Math.floor(Math.random() * 201);
+  window.scrollTo(0, y);
+  setTimeout(step, minPause + Math.random() * (maxPause - minPause));
+})();
+"""
+
+
+def human_scroll(
+    driver: Chrome,
+    *,
+    min_pause: float = 0.3,
+    max_pause: float = 0.8,
+    max_duration: float = 25.0,
+) -> None:
+    """Simulate human-like scrolling behavior.
+
+    The whole sequence runs in the page as a single async script, so it costs
+    one driver round trip regardless of page length. ``max_duration`` keeps it
+    inside WebDriver's default 30 second script timeout.
+    """
+    try:
+        driver.execute_async_script(
+            _HUMAN_SCROLL_JS, min_pause * 1000, max_pause * 1000, max_duration * 1000
+        )
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("Scroll script failed: %s", exc)
 
 
 def clear_cookies(driver: Chrome) -> None:
@@ -0,0 +1,169 @@
+"""Small SQLite-backed caches for fetched documents and lookups."""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Default upper bound on the bytes kept on disk (2 GiB).
+DEFAULT_SIZE_LIMIT = 2 << 30
+# Number of recently used values also kept in memory.
+MEMORY_ITEMS = 16
+
+_BLOB_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL
+)
+"""
+
+
+class BlobCache:
+    """Key/value store for ``bytes`` with a small in-memory LRU in front.
+
+    Values live in an SQLite file under ``path`` and the least recently used
+    entries are evicted once the total exceeds ``size_limit`` bytes. Only the
+    last ``memory_items`` values stay in RAM, so memory use no longer grows
+    with the number of documents fetched. With ``path=None`` only the
+    in-memory tier is used. The database is created on the first write.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None,
+        *,
+        size_limit: int = DEFAULT_SIZE_LIMIT,
+        memory_items: int = MEMORY_ITEMS,
+    ) -> None:
+        self.path = Path(path) if path is not None else None
+        self.size_limit = size_limit
+        self.memory_items = memory_items
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._size = 0
+
+    def _db(self, *, create: bool) -> Optional[sqlite3.Connection]:
+        if self._conn is None and self.path is not None:
+            db_file = self.path / "cache.sqlite"
+            if not create and not db_file.exists():
+                return None
+            self.path.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(db_file), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(_BLOB_SCHEMA)
+            self._conn.commit()
+            row = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()
+            self._size = row[0]
+        return self._conn
+
+    def _remember(self, key: str, value: bytes) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the value stored for ``key`` or ``None``."""
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                return value
+            conn = self._db(create=False)
+            if conn is None:
+                return None
+            row = conn.execute("SELECT value FROM blobs WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE blobs SET accessed = ? WHERE key = ?", (time.time(), key))
+            conn.commit()
+            value = bytes(row[0])
+            self._remember(key, value)
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def put(self, key: str, value: bytes, *, persist: bool = True) -> None:
+        """Store ``value``; with ``persist=False`` it is only kept in memory."""
+        with self._lock:
+            self._remember(key, value)
+            if not persist:
+                return
+            conn = self._db(create=True)
+            if conn is None:
+                return
+            old = conn.execute("SELECT size FROM blobs WHERE key = ?", (key,)).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO blobs (key, value, size, accessed) VALUES (?, ?, ?, ?)",
+                (key, sqlite3.Binary(value), len(value), time.time()),
+            )
+            self._size += len(value) - (old[0] if old else 0)
+            self._evict(conn)
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        if self._size <= self.size_limit:
+            return
+        rows = conn.execute("SELECT key, size FROM blobs ORDER BY accessed").fetchall()
+        for key, size in rows:
+            if self._size <= self.size_limit:
+                break
+            conn.execute("DELETE FROM blobs WHERE key = ?", (key,))
+            self._size -= size
+            logger.debug("Evicted %s from %s", key, self.path)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class TextCache:
+    """Persistent ``str`` to ``str`` mapping, e.g. organization name to website.
+
+    Lets repeated runs skip lookups whose answer is already known.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS texts (key TEXT PRIMARY KEY, value TEXT NOT NULL, stored_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the value stored for ``key`` or ``None``."""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM texts WHERE key = ?", (key,)).fetchone()
+        return None if row is None else row[0]
+
+    def put(self, key: str, value: str) -> None:
+        """Store ``value`` for ``key``, replacing any previous entry."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO texts (key, value, stored_at) VALUES (?, ?, ?)",
+                (key, value, time.time()),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
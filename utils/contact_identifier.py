@@ -4,10 +4,29 @@ from __future__ import annotations
 
 import logging
 import re
+from bisect import bisect_right
 from dataclasses import dataclass
 from datetime import datetime
 from difflib import SequenceMatcher
-from typing import Dict, Iterable, List, Optional
+from functools import lru_cache
+from itertools import accumulate
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+try:
+    from rapidfuzz import fuzz, process  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    fuzz = process = None
+
+try:
+    # RapidFuzz's cdist returns a NumPy array but doesn't require NumPy.
+    import numpy  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    numpy = None
+
+try:
+    import ahocorasick  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    ahocorasick = None
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +34,7 @@ logger = logging.getLogger(__name__)
 # Dataclasses
 # ----------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class Contact:
     """Raw contact information from a single source."""
 
@@ -27,7 +46,7 @@ class Contact:
     updated_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchedContact:
     """Contact matched to a target role with a confidence score."""
 
@@ -46,11 +65,15 @@ class MatchedContact:
 # Helper functions
 # ----------------------------------------------------------------------
 
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+@lru_cache(maxsize=8192)
 def normalize_title(title: str) -> str:
     """Normalize a title string for matching."""
 
-    title = title.lower()
-    title = re.sub(r"[^a-z0-9]+", " ", title)
+    original = title
+    title = _NON_ALNUM.sub(" ", title.lower())
     title = " ".join(title.split())
     replacements = {
         "cfo": "chief financial officer",
@@ -59,16 +82,110 @@ def normalize_title(title: str) -> str:
     for abbr, full in replacements.items():
         if title == abbr or title.startswith(f"{abbr} "):
             title = title.replace(abbr, full, 1)
-    logger.debug("Normalized title '%s' -> '%s'", title, title)
+    logger.debug("Normalized title '%s' -> '%s'", original, title)
     return title
 
 
 def fuzzy_ratio(a: str, b: str) -> float:
     """Return a simple similarity ratio between two strings."""
 
+    if fuzz is not None:
+        return fuzz.ratio(a, b) / 100.0
     return SequenceMatcher(None, a, b).ratio()
 
 
+class KeywordMatcher:
+    """Aho-Corasick keyword matcher offering the ``search`` part of the ``re`` API.
+
+    All keywords are found in a single pass over the text, however many there
+    are. ``search`` returns ``(end_index, keyword)`` for the first hit or
+    ``None``.
+    """
+
+    __slots__ = ("_automaton",)
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        self._automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            self._automaton.add_word(keyword.lower(), keyword)
+        self._automaton.make_automaton()
+
+    def search(self, text: str) -> Optional[Tuple[int, str]]:
+        return next(self._automaton.iter(text.lower()), None)
+
+    def iter_ends(self, text: str) -> Iterator[int]:
+        """Yield the end index of every keyword hit in already lowercased ``text``."""
+        return (end for end, _ in self._automaton.iter(text))
+
+
+RoleMatcher = Union["re.Pattern[str]", KeywordMatcher]
+
+
+@lru_cache(maxsize=256)
+def _compile_roles(roles: Tuple[str, ...]) -> RoleMatcher:
+    if ahocorasick is not None and roles:
+        return KeywordMatcher(roles)
+    return re.compile("|".join(map(re.escape, roles)), re.IGNORECASE)
+
+
+def role_pattern(roles: Iterable[str]) -> RoleMatcher:
+    """Return a cached case-insensitive matcher for any of ``roles``.
+
+    Uses an Aho-Corasick automaton when ``pyahocorasick`` is installed and a
+    regex alternation otherwise; both expose ``search``.
+    """
+
+    # Matching ignores case, so roles differing only in case share an entry.
+    return _compile_roles(tuple(sorted({r.lower() for r in roles})))
+
+
+def matching_lines(lines: Sequence[str], pattern: RoleMatcher) -> List[int]:
+    """Return the indices of ``lines`` containing a match of ``pattern``.
+
+    The lines are scanned as one newline-joined string, so the matcher walks
+    the whole text natively instead of being called once per line.
+    """
+
+    if not lines:
+        return []
+    if isinstance(pattern, KeywordMatcher):
+        lines = [line.lower() for line in lines]
+    starts = list(accumulate((len(line) + 1 for line in lines[:-1]), initial=0))
+    text = "\n".join(lines)
+    hits: List[int] = []
+    if isinstance(pattern, KeywordMatcher):
+        for end in pattern.iter_ends(text):
+            idx = bisect_right(starts, end) - 1
+            if not hits or hits[-1] != idx:
+                hits.append(idx)
+        return hits
+    pos = 0
+    while True:
+        match = pattern.search(text, pos)
+        if match is None:
+            break
+        idx = bisect_right(starts, match.start()) - 1
+        hits.append(idx)
+        if idx + 1 >= len(starts):
+            break
+        # Resume at the next line; one hit per line is enough.
+        pos = starts[idx + 1]
+    return hits
+
+
+# Minimum similarity for a fuzzy title match.
+FUZZY_THRESHOLD = 0.85
+
+
+def _best_fuzzy(title: str, patterns: List[str]) -> float:
+    """Return the best similarity between ``title`` and any of ``patterns``."""
+
+    if process is not None:
+        match = process.extractOne(title, patterns, scorer=fuzz.ratio)
+        return match[1] / 100.0 if match else 0.0
+    return max((fuzzy_ratio(title, p) for p in patterns), default=0.0)
+
+
 # ----------------------------------------------------------------------
 # Main identifier
 # ----------------------------------------------------------------------
@@ -95,18 +212,70 @@ class ContactIdentifier:
             role: [normalize_title(p) for p in patterns]
             for role, patterns in self.ROLE_PATTERNS.items()
         }
+        self.pattern_sets = {role: frozenset(pats) for role, pats in self.patterns.items()}
+        # Shortest first: short patterns are the likeliest substring hits.
+        self._by_length = {
+            role: sorted(pats, key=len) for role, pats in self.patterns.items()
+        }
+        # All patterns in one flat list, with each role's columns as a slice,
+        # so fuzzy scores for a whole batch can be computed in one call.
+        self._flat_patterns: List[str] = []
+        self._role_slices: Dict[str, slice] = {}
+        for role, patterns in self.patterns.items():
+            start = len(self._flat_patterns)
+            self._flat_patterns.extend(patterns)
+            self._role_slices[role] = slice(start, len(self._flat_patterns))
 
     # --------------------------------------------------------------
-    def _title_score(self, title: str, role: str) -> float:
-        normalized = normalize_title(title)
-        patterns = self.patterns[role]
-        if normalized in patterns:
+    def _fuzzy_matrix(self, titles: List[str]) -> Optional[Dict[str, Dict[int, float]]]:
+        """Return the best fuzzy ratio per role, keyed by title index, or ``None``.
+
+        Only titles missing the exact/substring fast path for some role are
+        scored, all at once with :func:`rapidfuzz.process.cdist`. Without
+        RapidFuzz or NumPy, scores are computed lazily per contact in
+        :meth:`_title_score` instead.
+        """
+
+        if process is None or numpy is None:
+            return None
+        misses = [
+            i for i, title in enumerate(titles)
+            if any(self._fast_score(title, role) is None for role in self.patterns)
+        ]
+        if not misses:
+            return None
+        scores = process.cdist(
+            [titles[i] for i in misses], self._flat_patterns, scorer=fuzz.ratio, workers=-1
+        )
+        return {
+            role: dict(zip(misses, (scores[:, cols].max(axis=1) / 100.0).tolist()))
+            for role, cols in self._role_slices.items()
+        }
+
+    # --------------------------------------------------------------
+    def _fast_score(self, normalized: str, role: str) -> Optional[float]:
+        """Score exact and substring matches; ``None`` if neither applies."""
+        if normalized in self.pattern_sets[role]:
             return 1.0
-        for p in patterns:
-            if p in normalized or normalized in p:
-                return 0.8
-            if fuzzy_ratio(normalized, p) > 0.85:
-                return 0.6
+        if any(p in normalized or normalized in p for p in self._by_length[role]):
+            return 0.8
+        return None
+
+    # --------------------------------------------------------------
+    def _title_score(self, title: str, role: str, fuzzy: Optional[float] = None) -> float:
+        return self._title_score_norm(normalize_title(title), role, fuzzy)
+
+    def _title_score_norm(
+        self, normalized: str, role: str, fuzzy: Optional[float] = None
+    ) -> float:
+        """Score an already normalized title against ``role``."""
+        fast = self._fast_score(normalized, role)
+        if fast is not None:
+            return fast
+        if fuzzy is None:
+            fuzzy = _best_fuzzy(normalized, self.patterns[role])
+        if fuzzy > FUZZY_THRESHOLD:
+            return 0.6
         return 0.0
 
     # --------------------------------------------------------------
@@ -121,10 +290,12 @@ class ContactIdentifier:
         return score
 
     # --------------------------------------------------------------
-    def _recency_score(self, contact: Contact) -> float:
+    def _recency_score(self, contact: Contact, now: Optional[datetime] = None) -> float:
         if not contact.updated_at:
             return 0.0
-        age_days = (datetime.utcnow() - contact.updated_at).days
+        if now is None:
+            now = datetime.utcnow()
+        age_days = (now - contact.updated_at).days
         if age_days < 365:
             return 0.2
         if age_days < 730:
@@ -136,21 +307,33 @@ class ContactIdentifier:
         return self.SOURCE_WEIGHTS.get(contact.source, self.SOURCE_WEIGHTS["other"])
 
     # --------------------------------------------------------------
-    def _total_score(self, contact: Contact, role: str) -> float:
-        score = 0.0
-        score += self._title_score(contact.title, role)
-        score += self._source_score(contact)
-        score += self._completeness_score(contact)
-        score += self._recency_score(contact)
-        return score
+    def _contact_score(self, contact: Contact, now: Optional[datetime] = None) -> float:
+        """Role-independent part of the total score."""
+        return (
+            self._source_score(contact)
+            + self._completeness_score(contact)
+            + self._recency_score(contact, now)
+        )
+
+    # --------------------------------------------------------------
+    def _total_score(
+        self,
+        contact: Contact,
+        role: str,
+        title_score: Optional[float] = None,
+        now: Optional[datetime] = None,
+    ) -> float:
+        if title_score is None:
+            title_score = self._title_score(contact.title, role)
+        return title_score + self._contact_score(contact, now)
 
     # --------------------------------------------------------------
     def categorize_contacts(self, contacts: Iterable[Dict[str, object]]) -> List[MatchedContact]:
         """Match contacts to target roles and return scored results."""
 
         candidates: Dict[str, List[MatchedContact]] = {role: [] for role in self.patterns}
-        for data in contacts:
-            contact = Contact(
+        parsed = [
+            Contact(
                 name=str(data.get("name", "")),
                 title=str(data.get("title", "")),
                 source=str(data.get("source", "other")),
@@ -158,11 +341,22 @@ class ContactIdentifier:
                 phone=data.get("phone"),
                 updated_at=data.get("updated_at"),
             )
+            for data in contacts
+        ]
+        titles = [normalize_title(c.title) for c in parsed]
+        fuzzy = self._fuzzy_matrix(titles)
+        now = datetime.utcnow()
+        for i, (contact, normalized) in enumerate(zip(parsed, titles)):
+            base_score: Optional[float] = None
             for role in self.patterns:
-                title_score = self._title_score(contact.title, role)
+                title_score = self._title_score_norm(
+                    normalized, role, fuzzy[role].get(i) if fuzzy else None
+                )
                 if title_score == 0.0:
                     continue
-                raw_score = self._total_score(contact, role)
+                if base_score is None:
+                    base_score = self._contact_score(contact, now)
+                raw_score = title_score + base_score
                 matched = MatchedContact(
                     name=contact.name,
                     title=contact.title,
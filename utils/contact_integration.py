@@ -27,19 +27,52 @@ import csv
 import json
 import logging
 import os
-from dataclasses import dataclass, field
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+from itertools import chain
 from pathlib import Path
-from typing import Iterable, List, Optional, Dict, Any
+from typing import BinaryIO, Iterable, List, Optional, Dict, Any
 
 from .organization_processor import OrganizationProcessor, Organization
 from .website_scraper import WebsiteScraper, OrgRecord
 from .public_filings import PublicFilingsFinder
 from .contact_identifier import normalize_title
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Processed organizations between checkpoint saves.
+CHECKPOINT_EVERY = 50
+# Maximum seconds between checkpoint saves while organizations are processed.
+CHECKPOINT_MAX_AGE = 30.0
+# Processed organizations between rewriting the snapshot and truncating the WAL.
+CHECKPOINT_COMPACT_EVERY = 500
+# Threads used to query sources concurrently in discover_contacts.
+MAX_WORKERS = 8
+
+# Column order used by the CSV and Excel exports.
+HEADERS = (
+    "org_ein",
+    "org_name",
+    "name",
+    "title",
+    "email",
+    "phone",
+    "confidence",
+    "sources",
+)
+
 
-@dataclass
+def _normalize_name(name: str) -> str:
+    return " ".join(name.lower().split())
+
+
+@dataclass(slots=True)
 class ContactRecord:
     """Aggregated contact information for an executive."""
 
@@ -51,6 +84,31 @@ class ContactRecord:
     confidence: float = 0.0
     email: Optional[str] = None
     phone: Optional[str] = None
+    # Merge key derived from name and title; not exported.
+    _key: str = field(default="", repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if not self._key:
+            self._key = f"{_normalize_name(self.name)}|{normalize_title(self.title)}"
+
+
+# Exported fields of ContactRecord, in declaration order.
+_FIELDS = tuple(f.name for f in fields(ContactRecord) if not f.name.startswith("_"))
+
+
+def _record_dict(record: ContactRecord) -> Dict[str, Any]:
+    return {name: getattr(record, name) for name in _FIELDS}
+
+
+def _dumps(data: Any) -> bytes:
+    # orjson skips underscore-prefixed dataclass fields such as ``_key``.
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_DATACLASS)
+    return json.dumps(data, default=_record_dict).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    return orjson.loads(raw) if orjson else json.loads(raw)
 
 
 class ContactIntegration:
@@ -72,6 +130,9 @@ class ContactIntegration:
         linkedin_finder: Any,
         database_finder: Any | None = None,
         checkpoint_file: str | None = None,
+        checkpoint_interval: int = CHECKPOINT_EVERY,
+        checkpoint_max_age: float = CHECKPOINT_MAX_AGE,
+        checkpoint_compact_every: int = CHECKPOINT_COMPACT_EVERY,
     ) -> None:
         self.csv_processor = csv_processor
         self.website_scraper = website_scraper
@@ -81,30 +142,118 @@ class ContactIntegration:
         self.checkpoint_file = Path(checkpoint_file) if checkpoint_file else None
         self.results: List[ContactRecord] = []
         self._processed: set[int] = set()
-        if self.checkpoint_file and self.checkpoint_file.exists():
+        self.checkpoint_interval = checkpoint_interval
+        self.checkpoint_max_age = checkpoint_max_age
+        self.checkpoint_compact_every = checkpoint_compact_every
+        # Merged contacts before the confidence filter, keyed by merge key.
+        self._contacts: Dict[str, ContactRecord] = {}
+        self._dirty_count = 0
+        self._last_save = time.monotonic()
+        # Write-ahead log of per-organization results since the last snapshot.
+        self._wal_file = self.checkpoint_file.with_suffix(".wal") if self.checkpoint_file else None
+        self._wal: Optional[BinaryIO] = None
+        self._wal_buffer: List[bytes] = []
+        self._seq = 0
+        self._snapshot_seq = 0
+        if self.checkpoint_file and (
+            self.checkpoint_file.exists() or self._wal_file.exists()
+        ):
             self._load_checkpoint()
 
     # ------------------------------------------------------------------
     # Checkpoint helpers
     # ------------------------------------------------------------------
     def _load_checkpoint(self) -> None:
+        """Load the last snapshot, then replay the WAL entries written after it."""
+
         logger.info("Loading checkpoint from %s", self.checkpoint_file)
-        data = json.loads(self.checkpoint_file.read_text())
-        for r in data.get("results", []):
-            self.results.append(ContactRecord(**r))
-        self._processed = set(data.get("processed", []))
+        if self.checkpoint_file.exists():
+            data = _loads(self.checkpoint_file.read_bytes())
+            for r in data.get("results", []):
+                record = ContactRecord(**r)
+                self._contacts[record._key] = record
+            self._processed = set(data.get("processed", []))
+            self._snapshot_seq = self._seq = data.get("seq", 0)
+        if self._wal_file.exists():
+            with self._wal_file.open("rb") as f:
+                for line in f:
+                    try:
+                        entry = _loads(line)
+                    except ValueError:
+                        # A torn final line from an interrupted append.
+                        logger.warning("Ignoring truncated WAL entry in %s", self._wal_file)
+                        break
+                    if entry["seq"] <= self._snapshot_seq:
+                        continue
+                    for r in entry["contacts"]:
+                        self._merge_contacts(self._contacts, ContactRecord(**r))
+                    self._processed.add(entry["ein"])
+                    self._seq = entry["seq"]
+        self.results = list(self._contacts.values())
+
+    def _log_processed(self, ein: int, contacts: List[ContactRecord]) -> None:
+        """Queue a WAL entry for one processed organization.
+
+        Serialized before the contacts are merged, since merging mutates the
+        first record seen for each key.
+        """
+
+        if not self.checkpoint_file:
+            return
+        self._seq += 1
+        entry = {"seq": self._seq, "ein": ein, "contacts": contacts}
+        self._wal_buffer.append(_dumps(entry) + b"\n")
 
     def _save_checkpoint(self) -> None:
+        """Append queued entries to the WAL, compacting it when it grows long.
+
+        Each save costs only the organizations processed since the previous
+        one; the full snapshot is rewritten every ``checkpoint_compact_every``
+        organizations.
+        """
+
         if not self.checkpoint_file:
             return
+        if self._wal_buffer:
+            if self._wal is None:
+                self._wal = self._wal_file.open("ab")
+            self._wal.write(b"".join(self._wal_buffer))
+            self._wal.flush()
+            os.fsync(self._wal.fileno())
+            self._wal_buffer.clear()
+        if self._seq - self._snapshot_seq >= self.checkpoint_compact_every:
+            self._compact()
+        self._dirty_count = 0
+        self._last_save = time.monotonic()
+        logger.debug("Checkpoint saved to %s", self._wal_file)
+
+    def _compact(self) -> None:
+        """Atomically write a full snapshot and truncate the WAL."""
+
         data = {
-            "results": [r.__dict__ for r in self.results],
+            "results": list(self._contacts.values()),
             "processed": sorted(self._processed),
+            "seq": self._seq,
         }
         tmp = self.checkpoint_file.with_suffix(".tmp")
-        tmp.write_text(json.dumps(data, indent=2))
+        with tmp.open("wb") as f:
+            f.write(_dumps(data))
+            f.flush()
+            os.fsync(f.fileno())
         os.replace(tmp, self.checkpoint_file)
-        logger.debug("Checkpoint saved to %s", self.checkpoint_file)
+        # Entries up to ``seq`` are skipped on replay, so a crash before the
+        # truncate below cannot apply them twice.
+        self._snapshot_seq = self._seq
+        if self._wal is not None:
+            self._wal.truncate(0)
+        elif self._wal_file.exists():
+            self._wal_file.write_bytes(b"")
+        logger.debug("Checkpoint compacted to %s", self.checkpoint_file)
+
+    def _close_wal(self) -> None:
+        if self._wal is not None:
+            self._wal.close()
+            self._wal = None
 
     # ------------------------------------------------------------------
     # Scoring and merge helpers
@@ -113,24 +262,23 @@ class ContactIntegration:
         weight = self.SOURCE_WEIGHTS.get(source, 0.5)
         return weight * confidence
 
-    @staticmethod
-    def _normalize_name(name: str) -> str:
-        return " ".join(name.lower().split())
+    _normalize_name = staticmethod(_normalize_name)
 
     def _merge_contacts(self, contacts: Dict[str, ContactRecord], info: ContactRecord) -> None:
-        key = f"{self._normalize_name(info.name)}|{normalize_title(info.title)}"
-        existing = contacts.get(key)
+        existing = contacts.get(info._key)
         if existing:
             existing.confidence = min(1.0, existing.confidence + info.confidence * 0.5)
             if info.email and not existing.email:
                 existing.email = info.email
             if info.phone and not existing.phone:
                 existing.phone = info.phone
+            # At most one entry per source kind (four today), so a list scan
+            # is cheaper than keeping a set alongside it.
             for src in info.sources:
                 if src not in existing.sources:
                     existing.sources.append(src)
         else:
-            contacts[key] = info
+            contacts[info._key] = info
 
     # ------------------------------------------------------------------
     # Source wrappers
@@ -218,81 +366,113 @@ class ContactIntegration:
         target_roles: Iterable[str],
         batch_size: int = 10,
         min_confidence: float = 0.6,
+        max_workers: int = MAX_WORKERS,
     ) -> List[ContactRecord]:
-        """Process organizations and return discovered contacts."""
+        """Process organizations and return discovered contacts.
 
-        all_contacts: Dict[str, ContactRecord] = {
-            f"{self._normalize_name(r.name)}|{normalize_title(r.title)}": r
-            for r in self.results
-        }
-        batch = self.csv_processor.get_next_batch(size=batch_size)
-        while batch:
-            for org in batch:
-                if org.ein in self._processed:
-                    continue
-                logger.info("Processing EIN %s - %s", org.ein, org.organization_name)
-                contacts = []
-                contacts.extend(self._from_website(org, target_roles))
-                contacts.extend(self._from_filings(org, target_roles))
-                contacts.extend(self._from_database(org, target_roles))
-                contacts.extend(self._from_linkedin(org, target_roles))
-                for c in contacts:
-                    self._merge_contacts(all_contacts, c)
-                self.csv_processor.mark_processed(org.ein)
-                self._processed.add(org.ein)
+        Every source for every organization in a batch is queried
+        concurrently on a pool of ``max_workers`` threads. Results are merged
+        on the calling thread in organization and source order, so the output
+        matches a sequential run.
+        """
+
+        roles = list(target_roles)
+        sources = (self._from_website, self._from_filings, self._from_database, self._from_linkedin)
+        all_contacts = self._contacts
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                batch = self.csv_processor.get_next_batch(size=batch_size)
+                while batch:
+                    pending = [
+                        (org, [executor.submit(fn, org, roles) for fn in sources])
+                        for org in batch
+                        if org.ein not in self._processed
+                    ]
+                    for org, futures in pending:
+                        logger.info("Processing EIN %s - %s", org.ein, org.organization_name)
+                        found = list(chain.from_iterable(f.result() for f in futures))
+                        self._log_processed(org.ein, found)
+                        for c in found:
+                            self._merge_contacts(all_contacts, c)
+                        self.csv_processor.mark_processed(org.ein)
+                        self._processed.add(org.ein)
+                        self._dirty_count += 1
+                        if (
+                            self._dirty_count >= self.checkpoint_interval
+                            or time.monotonic() - self._last_save >= self.checkpoint_max_age
+                        ):
+                            self._save_checkpoint()
+                    batch = self.csv_processor.get_next_batch(size=batch_size)
+        finally:
+            if self._dirty_count:
                 self._save_checkpoint()
-            batch = self.csv_processor.get_next_batch(size=batch_size)
+            self._close_wal()
 
         self.results = [r for r in all_contacts.values() if r.confidence >= min_confidence]
         return self.results
 
     # ------------------------------------------------------------------
+    @staticmethod
+    def _export_csv(path: Path, rows: Iterable[tuple]) -> None:
+        """Stream ``rows`` to a CSV file without holding them in memory."""
+
+        with path.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(HEADERS)
+            writer.writerows(rows)
+
+    @staticmethod
+    def _export_excel(path: Path, rows: Iterable[tuple]) -> None:
+        """Stream ``rows`` to an Excel workbook without holding the sheet in memory."""
+
+        try:
+            import xlsxwriter  # type: ignore
+        except Exception:  # pragma: no cover - optional dependency
+            xlsxwriter = None
+        if xlsxwriter:
+            wb = xlsxwriter.Workbook(str(path), {"constant_memory": True})
+            ws = wb.add_worksheet()
+            ws.write_row(0, 0, HEADERS)
+            for i, row in enumerate(rows, 1):
+                ws.write_row(i, 0, row)
+            wb.close()
+            return
+        try:
+            from openpyxl import Workbook
+        except Exception as exc:  # pragma: no cover - optional
+            raise RuntimeError("Excel export requires xlsxwriter or openpyxl") from exc
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet()
+        ws.append(HEADERS)
+        for row in rows:
+            ws.append(row)
+        wb.save(path)
+
     def export_results(self, path: str | Path) -> None:
         """Export results to JSON, CSV or Excel based on file extension."""
 
         path = Path(path)
         if path.suffix.lower() == ".json":
             with path.open("w", encoding="utf-8") as f:
-                json.dump([r.__dict__ for r in self.results], f, indent=2)
+                json.dump([_record_dict(r) for r in self.results], f, indent=2)
         elif path.suffix.lower() == ".csv":
-            with path.open("w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(
-                    f,
-                    fieldnames=[
-                        "org_ein",
-                        "org_name",
-                        "name",
-                        "title",
-                        "email",
-                        "phone",
-                        "confidence",
-                        "sources",
-                    ],
+            rows = (
+                (
+                    r.org_ein,
+                    r.org_name,
+                    r.name,
+                    r.title,
+                    r.email or "",
+                    r.phone or "",
+                    r.confidence,
+                    ";".join(r.sources),
                 )
-                writer.writeheader()
-                for r in self.results:
-                    row = r.__dict__.copy()
-                    row["sources"] = ";".join(r.sources)
-                    writer.writerow(row)
+                for r in self.results
+            )
+            self._export_csv(path, rows)
         elif path.suffix.lower() in {".xlsx", ".xls"}:
-            try:
-                from openpyxl import Workbook
-            except Exception as exc:  # pragma: no cover - optional
-                raise RuntimeError("Excel export requires openpyxl") from exc
-            wb = Workbook()
-            ws = wb.active
-            ws.append([
-                "org_ein",
-                "org_name",
-                "name",
-                "title",
-                "email",
-                "phone",
-                "confidence",
-                "sources",
-            ])
-            for r in self.results:
-                ws.append([
+            rows = (
+                (
                     r.org_ein,
                     r.org_name,
                     r.name,
@@ -301,8 +481,10 @@ class ContactIntegration:
                     r.phone or "",
                     r.confidence,
                     ",".join(r.sources),
-                ])
-            wb.save(path)
+                )
+                for r in self.results
+            )
+            self._export_excel(path, rows)
         else:
             raise ValueError(f"Unsupported file type: {path.suffix}")
 
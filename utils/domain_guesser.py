@@ -1,12 +1,24 @@
 import re
 import socket
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
 try:
     import requests  # type: ignore
+    from requests.adapters import HTTPAdapter  # type: ignore
 except Exception:  # pragma: no cover - fallback when requests not installed
     requests = None
 
+try:
+    import dns.resolver  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    dns = None
+
+# Seconds allowed for a candidate's DNS lookup.
+DNS_TIMEOUT = 3.0
+# Candidates probed at once; after a hit only these can still be in flight.
+GUESS_WORKERS = 2
+
 
 class DomainGuesser:
     """Guess possible domains for an organization name."""
@@ -15,6 +27,10 @@ class DomainGuesser:
 
     def __init__(self, tlds: Optional[List[str]] = None) -> None:
         self.tlds = tlds or self.COMMON_TLDS
+        self.session = None
+        if requests:
+            self.session = requests.Session()
+            self.session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
 
     @staticmethod
     def _normalize(name: str) -> str:
@@ -30,20 +46,43 @@ class DomainGuesser:
         return candidates
 
     def guess(self, name: str) -> Optional[str]:
-        for domain in self.generate_candidates(name):
-            if self._domain_exists(domain):
-                return domain
+        """Return the first candidate domain, in TLD order, that exists.
+
+        Up to :data:`GUESS_WORKERS` candidates are probed concurrently; once a
+        preferred domain is confirmed, probes not yet started are cancelled.
+        """
+        candidates = self.generate_candidates(name)
+        if not candidates:
+            return None
+        executor = ThreadPoolExecutor(max_workers=min(GUESS_WORKERS, len(candidates)))
+        try:
+            futures = [executor.submit(self._domain_exists, d) for d in candidates]
+            for domain, future in zip(candidates, futures):
+                if future.result():
+                    return domain
+        finally:
+            # Don't wait for probes of less preferred domains to finish.
+            executor.shutdown(wait=False, cancel_futures=True)
         return None
 
-    def _domain_exists(self, domain: str) -> bool:
-        """Check whether a domain resolves or responds."""
+    @staticmethod
+    def _resolves(domain: str) -> bool:
         try:
-            socket.gethostbyname(domain)
+            if dns:
+                dns.resolver.resolve(domain, "A", lifetime=DNS_TIMEOUT)
+            else:
+                socket.gethostbyname(domain)
         except Exception:
             return False
-        if requests:
+        return True
+
+    def _domain_exists(self, domain: str) -> bool:
+        """Check whether a domain resolves or responds."""
+        if not self._resolves(domain):
+            return False
+        if self.session:
             try:
-                resp = requests.head(f"https://{domain}", timeout=5)
+                resp = self.session.head(f"https://{domain}", timeout=5)
                 if resp.status_code < 400:
                     return True
             except Exception:
@@ -0,0 +1,210 @@
+"""Pool of pre-warmed stealth browser drivers."""
+
+from __future__ import annotations
+
+import logging
+import queue
+import random
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+
+from .browser_utils import USER_AGENTS, clear_cookies, create_stealth_driver
+
+try:
+    from selenium.common.exceptions import WebDriverException  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    WebDriverException = None
+
+if TYPE_CHECKING:  # pragma: no cover - imported lazily at runtime
+    from selenium.webdriver import Chrome
+
+logger = logging.getLogger(__name__)
+
+# Number of browser instances kept warm in the pool.
+POOL_SIZE = 3
+# Operations served by one instance before it is quit and replaced.
+MAX_USES_PER_INSTANCE = 10
+# Seconds to wait for a free instance before giving up.
+INSTANCE_TIMEOUT = 300.0
+
+# Cookie fields accepted by the DevTools ``Network.setCookies`` command.
+_COOKIE_PARAMS = (
+    "name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expires",
+)
+
+
+class StealthDriverPool:
+    """Bounded pool of stealth Chrome drivers.
+
+    Drivers are created eagerly so the chromedriver launch cost is paid once
+    up front rather than on every session rotation. Callers check a driver out
+    with :meth:`acquire` and must return it with :meth:`release`, or use
+    :meth:`lease` to get per-domain cookies and user agent as well.
+
+    A slot whose replacement browser fails to launch holds ``None`` and is
+    relaunched by the next :meth:`acquire`, so launch failures never shrink
+    the pool.
+    """
+
+    def __init__(
+        self,
+        *,
+        size: int = POOL_SIZE,
+        headless: bool = True,
+        max_uses: int = MAX_USES_PER_INSTANCE,
+        instance_timeout: float = INSTANCE_TIMEOUT,
+    ) -> None:
+        self.size = size
+        self.headless = headless
+        self.max_uses = max_uses
+        self.instance_timeout = instance_timeout
+        self._queue: "queue.Queue[Optional[Chrome]]" = queue.Queue(maxsize=size)
+        self._uses: Dict[int, int] = {}
+        self._drivers: List[Chrome] = []
+        self._jars: Dict[str, List[Dict[str, Any]]] = {}
+        self._agents: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        for _ in range(size):
+            self._queue.put(self._spawn())
+
+    def _spawn(self) -> Chrome:
+        driver = create_stealth_driver(headless=self.headless)
+        with self._lock:
+            self._uses[id(driver)] = 0
+            self._drivers.append(driver)
+        return driver
+
+    def _retire(self, driver: Chrome) -> None:
+        with self._lock:
+            self._uses.pop(id(driver), None)
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        try:
+            driver.quit()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Error quitting driver: %s", exc)
+
+    def _replace(self, driver: Chrome) -> Optional[Chrome]:
+        """Quit ``driver`` and launch a new one, or return ``None`` on failure."""
+        self._retire(driver)
+        try:
+            return self._spawn()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Failed to launch replacement browser: %s", exc)
+            return None
+
+    def acquire(self) -> Chrome:
+        """Check out a driver, blocking until one is available."""
+        try:
+            driver = self._queue.get(timeout=self.instance_timeout)
+        except queue.Empty as exc:
+            raise TimeoutError("No browser instance available in pool") from exc
+        if driver is None:
+            try:
+                driver = self._spawn()
+            except BaseException:
+                self._queue.put(None)
+                raise
+        return driver
+
+    def recycle(self, driver: Chrome) -> Optional[Chrome]:
+        """Reset a used driver, replacing it once it has served ``max_uses``."""
+        clear_cookies(driver)
+        with self._lock:
+            uses = self._uses.get(id(driver), 0) + 1
+            self._uses[id(driver)] = uses
+        if uses >= self.max_uses:
+            logger.debug("Replacing browser instance after %d uses", uses)
+            return self._replace(driver)
+        return driver
+
+    def release(self, driver: Chrome, *, broken: bool = False) -> None:
+        """Return a driver to the pool; ``broken`` drivers are replaced."""
+        self._queue.put(self._replace(driver) if broken else self.recycle(driver))
+
+    @contextmanager
+    def lease(self, *, domain: str | None = None) -> Iterator[Chrome]:
+        """Borrow a driver set up with the cookie jar and user agent of ``domain``.
+
+        Cookies set while the driver is leased are saved back to that domain's
+        jar, so scrapers for different sites sharing the pool stay isolated.
+        """
+        driver = self.acquire()
+        broken = False
+        try:
+            if domain:
+                self._enter_domain(driver, domain)
+            yield driver
+        except BaseException as exc:
+            # A driver that failed at the WebDriver level may be dead; never
+            # hand it to the next caller.
+            broken = WebDriverException is not None and isinstance(exc, WebDriverException)
+            raise
+        finally:
+            if domain and not broken:
+                self._save_jar(driver, domain)
+            self.release(driver, broken=broken)
+
+    def _enter_domain(self, driver: Chrome, domain: str) -> None:
+        with self._lock:
+            agent = self._agents.setdefault(domain, random.choice(USER_AGENTS))
+            jar = list(self._jars.get(domain, []))
+        try:
+            driver.execute_cdp_cmd("Network.setUserAgentOverride", {"userAgent": agent})
+            if jar:
+                driver.execute_cdp_cmd("Network.setCookies", {"cookies": jar})
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("Failed to restore context for %s: %s", domain, exc)
+
+    def _save_jar(self, driver: Chrome, domain: str) -> None:
+        try:
+            cookies = driver.execute_cdp_cmd("Network.getAllCookies", {}).get("cookies", [])
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("Failed to save cookies for %s: %s", domain, exc)
+            return
+        jar = [
+            {k: c[k] for k in _COOKIE_PARAMS if k in c}
+            for c in cookies
+            if c.get("domain", "").lstrip(".").endswith(domain)
+        ]
+        with self._lock:
+            self._jars[domain] = jar
+
+    def close(self) -> None:
+        """Quit every driver owned by the pool."""
+        with self._lock:
+            drivers = list(self._drivers)
+        for driver in drivers:
+            self._retire(driver)
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+
+_shared_pool: Optional[StealthDriverPool] = None
+_shared_lock = threading.Lock()
+
+
+def get_pool(**kwargs: Any) -> StealthDriverPool:
+    """Return the process-wide driver pool, creating it on first use.
+
+    ``kwargs`` are passed to :class:`StealthDriverPool` and only take effect
+    when the pool is created.
+    """
+    global _shared_pool
+    with _shared_lock:
+        if _shared_pool is None:
+            _shared_pool = StealthDriverPool(**kwargs)
+        return _shared_pool
+
+
+def close_pool() -> None:
+    """Close the process-wide pool so the next :func:`get_pool` starts fresh."""
+    global _shared_pool
+    with _shared_lock:
+        pool, _shared_pool = _shared_pool, None
+    if pool is not None:
+        pool.close()
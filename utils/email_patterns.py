@@ -2,8 +2,11 @@ from __future__ import annotations
 
 """Email prediction and verification utilities."""
 
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Iterable, List, Dict, Optional
+import asyncio
 import logging
 import re
 import time
@@ -20,9 +23,41 @@ logger = logging.getLogger(__name__)
 
 
 EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
 
 
-@dataclass
+def is_valid_email(email: str) -> bool:
+    """Return whether ``email`` is syntactically valid.
+
+    Equivalent to ``EMAIL_RE.fullmatch`` but implemented with string methods:
+    one ``@``, no whitespace, and a dot inside the domain part.
+    """
+
+    local, _, domain = email.partition("@")
+    return (
+        bool(local)
+        and "." in domain[1:-1]
+        and "@" not in domain
+        and email.split() == [email]
+    )
+
+# Maximum number of MX lookups in flight at once.
+MX_CONCURRENCY = 32
+# Idle SMTP connections kept open, keyed by MX host.
+SMTP_POOL_SIZE = 8
+SMTP_TIMEOUT = 10
+
+
+@lru_cache(maxsize=2048)
+def _extract_domain(url: str) -> str:
+    parsed = urlparse(url)
+    host = parsed.netloc or parsed.path
+    if host.startswith("www."):
+        host = host[4:]
+    return host.lower()
+
+
+@dataclass(slots=True)
 class EmailCandidate:
     """Represents a generated email with confidence."""
 
@@ -41,10 +76,22 @@ class EmailPatternGenerator:
         "first_last": 0.1,  # industry specific
     }
 
+    # (name, weight, local-part template) in generation order.
+    _PATTERNS = (
+        ("first.last", PATTERN_WEIGHTS["first.last"], "{first}.{last}"),
+        ("flast", PATTERN_WEIGHTS["flast"], "{fi}{last}"),
+        ("firstname", PATTERN_WEIGHTS["firstname"], "{first}"),
+        ("f.last", PATTERN_WEIGHTS["f.last"], "{fi}.{last}"),
+        ("first_last", PATTERN_WEIGHTS["first_last"], "{first}_{last}"),
+    )
+
     def __init__(self, *, rate_limit: float = 1.0) -> None:
         self.rate_limit = rate_limit
         self._last_check = 0.0
         self._verify_cache: Dict[str, bool] = {}
+        self._mx_cache: Dict[str, List[str]] = {}
+        self._mx_ok: Dict[str, bool] = {}
+        self._smtp_pool: "OrderedDict[str, smtplib.SMTP]" = OrderedDict()
 
     # ------------------------------------------------------------------
     # Helpers
@@ -56,13 +103,7 @@ class EmailPatternGenerator:
         last = parts[-1] if len(parts) > 1 else ""
         return first, last
 
-    @staticmethod
-    def _extract_domain(url: str) -> str:
-        parsed = urlparse(url)
-        host = parsed.netloc or parsed.path
-        if host.startswith("www."):
-            host = host[4:]
-        return host.lower()
+    _extract_domain = staticmethod(_extract_domain)
 
     def discover_domain(self, contact: Dict[str, str]) -> Optional[str]:
         """Attempt to determine an organization's domain."""
@@ -75,7 +116,7 @@ class EmailPatternGenerator:
             return self._extract_domain(contact["domain"])
         org = contact.get("organization")
         if org:
-            base = re.sub(r"[^a-z0-9]+", "", org.lower())
+            base = _NON_ALNUM.sub("", org.lower())
             if base:
                 return f"{base}.com"
         return None
@@ -90,19 +131,16 @@ class EmailPatternGenerator:
         first, last = self._split_name(contact.get("name", ""))
         if not first:
             return []
-        fi = first[0]
-        patterns = {
-            "first.last": f"{first}.{last}@{domain}" if last else f"{first}@{domain}",
-            "flast": f"{fi}{last}@{domain}" if last else f"{fi}@{domain}",
-            "firstname": f"{first}@{domain}",
-            "f.last": f"{fi}.{last}@{domain}" if last else f"{fi}@{domain}",
-            "first_last": f"{first}_{last}@{domain}" if last else f"{first}@{domain}",
-        }
-        candidates = [
-            EmailCandidate(email=email, confidence=self.PATTERN_WEIGHTS.get(key, 0.1))
-            for key, email in patterns.items()
+        if not last:
+            return [
+                EmailCandidate(f"{first}@{domain}", self.PATTERN_WEIGHTS["first.last"]),
+                EmailCandidate(f"{first[0]}@{domain}", self.PATTERN_WEIGHTS["flast"]),
+            ]
+        parts = {"first": first, "last": last, "fi": first[0]}
+        return [
+            EmailCandidate(f"{template.format_map(parts)}@{domain}", weight)
+            for _, weight, template in self._PATTERNS
         ]
-        return candidates
 
     # ------------------------------------------------------------------
     def _respect_rate_limit(self) -> None:
@@ -111,37 +149,151 @@ class EmailPatternGenerator:
             time.sleep(self.rate_limit - elapsed)
         self._last_check = time.time()
 
+    def _resolve_mx(self, domain: str) -> List[str]:
+        """Return the MX hosts of ``domain`` by preference, resolving once per domain."""
+
+        hosts = self._mx_cache.get(domain)
+        if hosts is not None:
+            return hosts
+        hosts = []
+        if dns:
+            try:
+                records = dns.resolver.resolve(domain, "MX")
+                hosts = [str(r.exchange) for r in sorted(records, key=lambda r: r.preference)]
+            except Exception:  # noqa: BLE001
+                pass
+        self._mx_cache[domain] = hosts
+        return hosts
+
     def _check_mx(self, domain: str) -> bool:
-        if not dns:
-            return False
+        return bool(self._resolve_mx(domain))
+
+    def _mx_host(self, domain: str) -> Optional[str]:
+        hosts = self._resolve_mx(domain)
+        return hosts[0] if hosts else None
+
+    def _smtp_session(self, host: str) -> smtplib.SMTP:
+        """Return an open SMTP session for ``host``, reusing an idle one if possible."""
+
+        smtp = self._smtp_pool.pop(host, None)
+        if smtp is not None:
+            try:
+                smtp.rset()
+                return smtp
+            except Exception:  # noqa: BLE001
+                self._quit_smtp(smtp)
+        smtp = smtplib.SMTP(host, timeout=SMTP_TIMEOUT)
+        try:
+            smtp.helo()
+        except Exception:
+            self._quit_smtp(smtp)
+            raise
+        return smtp
+
+    def _park_smtp(self, host: str, smtp: smtplib.SMTP) -> None:
+        self._smtp_pool[host] = smtp
+        while len(self._smtp_pool) > SMTP_POOL_SIZE:
+            _, oldest = self._smtp_pool.popitem(last=False)
+            self._quit_smtp(oldest)
+
+    @staticmethod
+    def _quit_smtp(smtp: smtplib.SMTP) -> None:
         try:
-            dns.resolver.resolve(domain, "MX")
-            return True
+            smtp.quit()
         except Exception:  # noqa: BLE001
-            return False
+            smtp.close()
 
     def _smtp_check(self, email: str) -> bool:
         domain = email.split("@")[-1]
-        if not dns:
-            return False
+        return self._smtp_check_batch(domain, [email]).get(email, False)
+
+    def _smtp_check_batch(self, domain: str, emails: List[str]) -> Dict[str, bool]:
+        """Check several addresses on ``domain`` with one SMTP transaction."""
+
+        results = dict.fromkeys(emails, False)
+        host = self._mx_host(domain)
+        if not host:
+            return results
         try:
-            records = dns.resolver.resolve(domain, "MX")
-            host = str(sorted(records, key=lambda r: r.preference)[0].exchange)
+            self._respect_rate_limit()
+            smtp = self._smtp_session(host)
         except Exception:  # noqa: BLE001
-            return False
+            return results
         try:
-            self._respect_rate_limit()
-            with smtplib.SMTP(host, timeout=10) as smtp:
-                smtp.helo()
-                smtp.mail("<>")
+            smtp.mail("<>")
+            for email in emails:
                 code, _ = smtp.rcpt(email)
-                return code in (250, 251)
+                results[email] = code in (250, 251)
         except Exception:  # noqa: BLE001
-            return False
+            # The session is in an unknown state; don't hand it out again.
+            self._quit_smtp(smtp)
+            return results
+        self._park_smtp(host, smtp)
+        return results
+
+    def close(self) -> None:
+        """Close any pooled SMTP connections."""
+
+        while self._smtp_pool:
+            _, smtp = self._smtp_pool.popitem()
+            self._quit_smtp(smtp)
+
+    async def _resolve_domains(self, domains: Iterable[str]) -> None:
+        """Populate ``_mx_ok`` for ``domains`` with concurrent lookups."""
+
+        pending = [d for d in set(domains) if d not in self._mx_ok]
+        if not pending:
+            return
+        semaphore = asyncio.Semaphore(MX_CONCURRENCY)
+
+        async def resolve(domain: str) -> None:
+            async with semaphore:
+                self._mx_ok[domain] = await asyncio.to_thread(self._check_mx, domain)
+
+        await asyncio.gather(*(resolve(d) for d in pending))
 
     # ------------------------------------------------------------------
-    def verify_emails(self, candidates: Iterable[EmailCandidate]) -> List[EmailCandidate]:
-        """Verify generated emails and update confidence."""
+    def verify_emails(
+        self, candidates: Iterable[EmailCandidate], *, validate: bool = True
+    ) -> List[EmailCandidate]:
+        """Verify generated emails and update confidence.
+
+        Synchronous wrapper around :meth:`verify_emails_async`; it must not be
+        called from inside a running event loop.
+        """
+
+        return asyncio.run(self.verify_emails_async(candidates, validate=validate))
+
+    async def verify_emails_async(
+        self, candidates: Iterable[EmailCandidate], *, validate: bool = True
+    ) -> List[EmailCandidate]:
+        """Verify generated emails, resolving each unique domain once.
+
+        Pass ``validate=False`` to skip the syntax check for addresses that
+        are well-formed by construction, such as those from
+        :meth:`generate_candidates`.
+        """
+
+        candidates = list(candidates)
+        to_check: Dict[str, str] = {}
+        for cand in candidates:
+            email = cand.email
+            if email in self._verify_cache or email in to_check:
+                continue
+            if validate and not is_valid_email(email):
+                self._verify_cache[email] = False
+                continue
+            to_check[email] = email.rpartition("@")[2]
+        await self._resolve_domains(to_check.values())
+        by_domain: Dict[str, List[str]] = {}
+        for email, domain in to_check.items():
+            if self._mx_ok[domain]:
+                by_domain.setdefault(domain, []).append(email)
+        smtp_results: Dict[str, bool] = {}
+        for domain, emails in by_domain.items():
+            smtp_results.update(
+                await asyncio.to_thread(self._smtp_check_batch, domain, emails)
+            )
 
         verified: List[EmailCandidate] = []
         for cand in candidates:
@@ -151,12 +303,9 @@ class EmailPatternGenerator:
                 if ok:
                     verified.append(cand)
                 continue
-            if not EMAIL_RE.fullmatch(email):
-                self._verify_cache[email] = False
-                continue
-            domain = email.split("@")[-1]
-            mx_ok = self._check_mx(domain)
-            smtp_ok = self._smtp_check(email) if mx_ok else False
+            domain = to_check[email]
+            mx_ok = self._mx_ok[domain]
+            smtp_ok = smtp_results.get(email, False)
             score = cand.confidence
             if mx_ok:
                 score += 0.2
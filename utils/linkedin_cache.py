@@ -0,0 +1,119 @@
+"""SQLite-backed cache for scraped LinkedIn data."""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Default freshness window for cached entries (30 days).
+DEFAULT_TTL = 30 * 24 * 3600.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS linkedin_cache (
+    normalized_url TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    scraped_at REAL NOT NULL
+)
+"""
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a LinkedIn URL for use as a cache key."""
+    return url.split("?")[0].rstrip("/").lower()
+
+
+class LinkedInCache:
+    """Persistent cache of profile and search payloads keyed by URL.
+
+    Entries older than ``ttl`` seconds are treated as missing. Keys are
+    normalized with :func:`normalize_url` unless ``normalize=False`` is
+    passed, as for search keys whose query must be kept whole. The connection
+    is shared between threads and guarded by a lock.
+    """
+
+    def __init__(self, path: str | Path, *, ttl: float | None = DEFAULT_TTL) -> None:
+        self.path = Path(path)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def get(
+        self, url: str, ttl: float | None = None, *, normalize: bool = True
+    ) -> Optional[Any]:
+        """Return the cached payload for ``url`` or ``None`` if missing or stale."""
+        key = normalize_url(url) if normalize else url
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, scraped_at FROM linkedin_cache WHERE normalized_url = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            payload, scraped_at = row
+            if ttl is not None and time.time() - scraped_at > ttl:
+                logger.debug("Cache entry for %s expired", key)
+                return None
+        logger.debug("Cache hit for %s", key)
+        return json.loads(payload)
+
+    def put(self, url: str, payload: Any, *, normalize: bool = True) -> None:
+        """Store ``payload`` for ``url``, replacing any previous entry."""
+        key = normalize_url(url) if normalize else url
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO linkedin_cache (normalized_url, payload, scraped_at) "
+                "VALUES (?, ?, ?)",
+                (key, json.dumps(payload), time.time()),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class SeenProfileStore:
+    """Persistent set of profile URLs that have already been scraped."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen (url TEXT PRIMARY KEY, seen_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def __contains__(self, url: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM seen WHERE url = ?", (normalize_url(url),)
+            ).fetchone()
+        return row is not None
+
+    def add(self, url: str) -> None:
+        """Mark ``url`` as scraped."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO seen (url, seen_at) VALUES (?, ?)",
+                (normalize_url(url), time.time()),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
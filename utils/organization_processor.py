@@ -5,14 +5,37 @@ from __future__ import annotations
 import csv
 import logging
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from itertools import compress, filterfalse, islice
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Sequence
+
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.csv as pa_csv  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    pa = pa_csv = None
 
 logger = logging.getLogger(__name__)
 
+# CSV columns read into each Organization, in field order.
+CSV_FIELDS = (
+    "ein",
+    "organization_name",
+    "dba_name",
+    "entity_type",
+    "total_participants",
+    "plan_count",
+    "mail_us_address1",
+    "mail_us_address2",
+    "mail_us_city",
+    "mail_us_state",
+    "mail_us_zip",
+    "phone_num",
+)
+
 
-@dataclass
+@dataclass(slots=True)
 class Organization:
     """Data record for a single organization."""
 
@@ -28,72 +51,171 @@ class Organization:
     mail_us_state: str
     mail_us_zip: str
     phone_num: int
-    processed: bool = field(default=False)
+    # Deprecated: kept for callers of the old API; prefer tracking progress
+    # through OrganizationProcessor.mark_processed.
+    processed: bool = False
+
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
 
 
 def normalize_name(name: str) -> str:
     """Normalize organization names for searching."""
-    cleaned = re.sub(r"[^a-z0-9]+", " ", name.lower())
-    normalized = " ".join(cleaned.split())
+    normalized = _NON_ALNUM.sub(" ", name.lower()).strip()
     logger.debug("Normalized '%s' -> '%s'", name, normalized)
     return normalized
 
 
 class OrganizationProcessor:
-    """Load and batch process organizations from a CSV file."""
+    """Load and batch process organizations from a CSV file.
+
+    Rows are kept column-wise, one list per field, and :class:`Organization`
+    records are only built for the rows a caller asks for.
+    """
 
     def __init__(self, csv_path: str | Path) -> None:
         self.csv_path = Path(csv_path)
-        self.organizations: Dict[int, Organization] = {}
-        self._queue: List[int] = []
+        self._columns: Dict[str, List[Any]] = {name: [] for name in CSV_FIELDS}
+        self._ein_to_row: Dict[int, int] = {}
         self._processed: set[int] = set()
-        self._index = 0
+        # Records built by :attr:`organizations`, shared with later lookups.
+        self._records: Dict[int, Organization] | None = None
         self._load()
+        # Lazily walks EINs in file order, skipping those already processed.
+        self._pending: Iterator[int] = filterfalse(
+            self._processed.__contains__, iter(self._columns["ein"])
+        )
+
+    def _read_rows(self) -> Iterable[Sequence[Any]]:
+        """Yield one value tuple per CSV row, ordered as :data:`CSV_FIELDS`.
+
+        Missing columns yield ``None``. PyArrow's multithreaded reader is used
+        when installed, falling back to :class:`csv.DictReader`.
+        """
+        if pa_csv is not None:
+            # Every column is read as a string so values such as ZIP codes
+            # keep leading zeros; integer fields are converted in ``_load``.
+            table = pa_csv.read_csv(
+                self.csv_path,
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={name: pa.string() for name in CSV_FIELDS},
+                    include_columns=list(CSV_FIELDS),
+                    include_missing_columns=True,
+                    strings_can_be_null=False,
+                ),
+            )
+            return zip(*(table.column(name).to_pylist() for name in CSV_FIELDS))
+        return self._read_rows_csv()
+
+    def _read_rows_csv(self) -> Iterable[Sequence[Any]]:
+        with self.csv_path.open("r", newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                yield tuple(row.get(name) for name in CSV_FIELDS)
 
     def _load(self) -> None:
         logger.info("Loading organizations from %s", self.csv_path)
-        with self.csv_path.open("r", newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                try:
-                    ein = int(row.get("ein", 0))
-                except ValueError:
-                    logger.warning("Invalid EIN %s", row.get("ein"))
-                    continue
-                org = Organization(
-                    ein=ein,
-                    organization_name=row.get("organization_name", ""),
-                    dba_name=row.get("dba_name", ""),
-                    entity_type=row.get("entity_type", ""),
-                    total_participants=row.get("total_participants", ""),
-                    plan_count=int(row.get("plan_count", 0) or 0),
-                    mail_us_address1=row.get("mail_us_address1", ""),
-                    mail_us_address2=row.get("mail_us_address2", ""),
-                    mail_us_city=row.get("mail_us_city", ""),
-                    mail_us_state=row.get("mail_us_state", ""),
-                    mail_us_zip=row.get("mail_us_zip", ""),
-                    phone_num=int(row.get("phone_num", 0) or 0),
-                )
-                self.organizations[ein] = org
-                self._queue.append(ein)
-        logger.info("Loaded %d organizations", len(self.organizations))
+        self._records = None
+        for values in self._read_rows():
+            (
+                ein_raw, organization_name, dba_name, entity_type, total_participants,
+                plan_count, address1, address2, city, state, zip_code, phone_num,
+            ) = values
+            try:
+                ein = int(ein_raw if ein_raw is not None else 0)
+            except ValueError:
+                logger.warning("Invalid EIN %s", ein_raw)
+                continue
+            row = (
+                ein,
+                organization_name or "",
+                dba_name or "",
+                entity_type or "",
+                total_participants or "",
+                int(plan_count or 0),
+                address1 or "",
+                address2 or "",
+                city or "",
+                state or "",
+                zip_code or "",
+                int(phone_num or 0),
+            )
+            for column, value in zip(self._columns.values(), row):
+                column.append(value)
+            self._ein_to_row[ein] = len(self._columns["ein"]) - 1
+        logger.info("Loaded %d organizations", len(self._ein_to_row))
+
+    def _materialize(self, row: int) -> Organization:
+        if self._records is not None:
+            return self._records[self._columns["ein"][row]]
+        return self._build(row)
+
+    def _build(self, row: int) -> Organization:
+        return Organization(
+            *(column[row] for column in self._columns.values()),
+            processed=self._columns["ein"][row] in self._processed,
+        )
+
+    def get(self, ein: int) -> Organization | None:
+        """Return the organization with ``ein``, or ``None`` if unknown."""
+        row = self._ein_to_row.get(ein)
+        return None if row is None else self._materialize(row)
+
+    @property
+    def organizations(self) -> Mapping[int, Organization]:
+        """All organizations keyed by EIN.
+
+        Records for every row are built on first access and reused afterwards,
+        also by :meth:`get` and :meth:`records`, so changes to them persist.
+        Prefer :meth:`get_next_batch` or :meth:`get` for large files.
+        """
+        if self._records is None:
+            self._records = {ein: self._build(row) for ein, row in self._ein_to_row.items()}
+        return self._records
+
+    def select(
+        self,
+        *,
+        eins: Iterable[int] | None = None,
+        min_plan_count: int | None = None,
+        has_phone_number: bool = False,
+    ) -> List[int]:
+        """Return the rows of organizations passing every given filter.
+
+        Rows are ordered like :attr:`organizations`. The filters run over the
+        stored columns with C-level iterators, so no :class:`Organization` is
+        built; pass the rows to :meth:`records` for that.
+        """
+        rows: List[int] = list(self._ein_to_row.values())
+        masks = []
+        if eins is not None:
+            ids = {int(e) for e in eins}
+            masks.append(map(ids.__contains__, self._columns["ein"]))
+        if min_plan_count is not None:
+            masks.append(map(int(min_plan_count).__le__, self._columns["plan_count"]))
+        if has_phone_number:
+            masks.append(map(bool, self._columns["phone_num"]))
+        if masks:
+            keep = list(map(all, zip(*masks)))
+            rows = list(compress(rows, map(keep.__getitem__, rows)))
+        return rows
+
+    def records(self, rows: Iterable[int]) -> List[Organization]:
+        """Build the organizations stored at ``rows``."""
+        return [self._materialize(row) for row in rows]
 
     def get_next_batch(self, *, size: int = 10) -> List[Organization]:
         """Return the next batch of unprocessed organizations."""
-        batch: List[Organization] = []
-        while len(batch) < size and self._index < len(self._queue):
-            ein = self._queue[self._index]
-            self._index += 1
-            if ein in self._processed:
-                continue
-            batch.append(self.organizations[ein])
+        batch = [
+            self._materialize(self._ein_to_row[ein]) for ein in islice(self._pending, size)
+        ]
         logger.debug("Returning batch of %d organizations", len(batch))
         return batch
 
     def mark_processed(self, ein: int) -> None:
         """Mark an organization as processed."""
-        if ein in self.organizations:
+        if ein in self._ein_to_row:
             self._processed.add(ein)
-            self.organizations[ein].processed = True
+            if self._records is not None:
+                self._records[ein].processed = True
             logger.debug("Marked EIN %d as processed", ein)
 
@@ -2,7 +2,7 @@
 
 This module provides a small helper class for locating public filings such
 as Form 5500 documents and extracting officer contact information from them.
-Remote database access is rate limited and responses are cached to avoid
+Remote database access is rate limited and responses are cached on disk to avoid
 excessive requests.
 
 Example usage::
@@ -17,12 +17,17 @@ from __future__ import annotations
 import io
 import json
 import logging
-import re
-import time
+import multiprocessing
+import os
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cache
+from itertools import chain, islice
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Pattern
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 try:
     import pdfplumber  # type: ignore
@@ -33,10 +38,164 @@ try:
     import requests  # type: ignore
 except Exception:  # pragma: no cover - fallback for minimal envs
     requests = None
-from .rate_limiting import exponential_backoff
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.compute as pc  # type: ignore
+    import pyarrow.dataset as pa_ds  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    pa = pc = pa_ds = pq = None
+from .caching import BlobCache
+from .contact_identifier import RoleMatcher, matching_lines, role_pattern
+from .rate_limiting import TokenBucket, exponential_backoff
 
 logger = logging.getLogger(__name__)
 
+# Remote filings downloaded concurrently by ``extract_contacts``.
+FETCH_CONCURRENCY = 8
+# Requests allowed back to back before ``rate_limit`` spacing applies.
+FETCH_BURST = 5
+
+# PDFs in one extract_contacts call needed before parsing moves to the
+# process pool; fewer are parsed inline, which is cheaper than the hand-off.
+PDF_POOL_MIN = 4
+
+# Name of the Parquet index of filing metadata written by :func:`build_index`.
+FILINGS_INDEX = "filings_index.parquet"
+# Index schema metadata key recording which filings the index was built from.
+_INDEX_STATE_KEY = b"filings_state"
+
+
+# ASCII digits needed for a line to be taken as a phone number (555-1234).
+PHONE_MIN_DIGITS = 7
+_DIGITS = b"0123456789"
+
+
+def _looks_like_phone(line: str) -> bool:
+    # bytes.translate deletes the digits in a single C loop; the length drop
+    # is the digit count, with no regex engine involved.
+    raw = line.encode("utf-8", "ignore")
+    return len(raw) - len(raw.translate(None, _DIGITS)) >= PHONE_MIN_DIGITS
+
+
+def _loads(raw: bytes) -> object:
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def _filings_state(local_dir: Path) -> str:
+    """Summarize the JSON filings in ``local_dir`` as file count and newest mtime.
+
+    Only the top-level ``*.json`` files count, so caches kept in
+    subdirectories such as ``.fetch_cache`` never affect it.
+    """
+    mtimes = [file.stat().st_mtime_ns for file in Path(local_dir).glob("*.json")]
+    return f"{len(mtimes)}:{max(mtimes, default=0)}"
+
+
+def build_index(local_dir: Path) -> "pa.Table":
+    """Write a Parquet index of the JSON filings in ``local_dir``.
+
+    The index holds ``ein``, ``organization_name``, ``year``, ``form_type`` and
+    ``path`` for each filing so :meth:`PublicFilingsFinder.find_filings` can
+    answer queries without opening every file. Rebuild it after changing
+    filings; it is ignored once a filing is added, removed or modified.
+    """
+
+    if pa is None:
+        raise RuntimeError("build_index requires pyarrow")
+    columns: Dict[str, list] = {
+        "ein": [], "organization_name": [], "year": [], "form_type": [], "path": []
+    }
+    state = _filings_state(local_dir)
+    for file in sorted(Path(local_dir).glob("*.json")):
+        data = _loads(file.read_bytes())
+        columns["ein"].append(str(data.get("ein")))
+        columns["organization_name"].append(data.get("organization_name", ""))
+        columns["year"].append(int(data.get("year", 0)))
+        columns["form_type"].append(data.get("form_type", ""))
+        columns["path"].append(file.name)
+    table = pa.table(columns, metadata={_INDEX_STATE_KEY: state.encode()})
+    pq.write_table(table, Path(local_dir) / FILINGS_INDEX)
+    return table
+
+
+def _scan_pdf(
+    content: bytes, pattern: RoleMatcher, target_roles: Iterable[str] = ()
+) -> List[ContactInfo]:
+    """Extract contacts page by page, stopping once every role is found.
+
+    Pages are read lazily, so text after the last needed contact is never
+    extracted or held in memory.
+    """
+    if not pdfplumber:  # pragma: no cover - optional dependency
+        logger.warning("pdfplumber not available; skipping PDF parse")
+        return []
+    remaining = {r.lower() for r in target_roles}
+    contacts: List[ContactInfo] = []
+    with pdfplumber.open(io.BytesIO(content)) as pdf:
+        lines = chain.from_iterable(
+            (page.extract_text() or "").splitlines() for page in pdf.pages
+        )
+        for contact in PublicFilingsFinder._scan_lines(lines, pattern):
+            contacts.append(contact)
+            if remaining:
+                title = contact.title.lower()
+                remaining = {r for r in remaining if r not in title}
+                if not remaining:
+                    break
+    return contacts
+
+
+def _parse_pdf_worker(content: bytes, target_roles: Tuple[str, ...]) -> List[ContactInfo]:
+    """Process pool entry point; the role matcher is rebuilt in the worker."""
+    return _scan_pdf(content, role_pattern(target_roles), target_roles)
+
+
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+_pdf_pool_lock = threading.Lock()
+
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """Return the process-wide PDF parsing pool, creating it on first use.
+
+    Workers are started with "spawn": callers often run in thread pools, and
+    forking a multithreaded process can deadlock the child.
+    """
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            _pdf_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pdf_pool
+
+
+def close_pdf_pool() -> None:
+    """Shut down the PDF parsing pool; the next parse starts a fresh one."""
+    global _pdf_pool
+    with _pdf_pool_lock:
+        pool, _pdf_pool = _pdf_pool, None
+    if pool is not None:
+        pool.shutdown()
+
+
+@cache
+def _score(age_bucket: int, has_contact: bool, has_title: bool) -> float:
+    """Confidence for a filing contact; ``age_bucket`` is 0 (<=1y), 1 (<=3y) or 2."""
+    score = 0.5 + (0.3, 0.1, 0.0)[age_bucket]
+    if has_contact:
+        score += 0.1
+    if has_title:
+        score += 0.1
+    return min(score, 1.0)
+
 
 @dataclass
 class Filing:
@@ -49,6 +208,8 @@ class Filing:
     url: Optional[str] = None
     local_path: Optional[Path] = None
     content: Optional[bytes] = None
+    # Decoded JSON document for structured filings, once parsed.
+    parsed: Optional[Dict[str, object]] = None
 
 
 @dataclass
@@ -65,30 +226,41 @@ class ContactInfo:
 class PublicFilingsFinder:
     """Locate and parse public filings for union trust organizations."""
 
-    def __init__(self, *, rate_limit: float = 1.0, local_dir: Path | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        rate_limit: float = 1.0,
+        local_dir: Path | None = None,
+        max_concurrency: int = FETCH_CONCURRENCY,
+        cache_dir: Path | None = None,
+    ) -> None:
         self.rate_limit = rate_limit
-        self._last_request = 0.0
+        self._current_year = datetime.utcnow().year
+        self._bucket = (
+            TokenBucket(rate=1 / rate_limit, capacity=FETCH_BURST) if rate_limit > 0 else None
+        )
         self.local_dir = local_dir
+        self.max_concurrency = max_concurrency
         if requests:
             self.session = requests.Session()
         else:  # pragma: no cover - fallback
             self.session = None
-        self._cache: Dict[str, bytes] = {}
+        if cache_dir is None and local_dir is not None:
+            cache_dir = Path(local_dir) / ".fetch_cache"
+        self._cache = BlobCache(cache_dir)
 
     # ------------------------------------------------------------------
     # Networking helpers
     # ------------------------------------------------------------------
     def _sleep_if_needed(self) -> None:
-        now = time.time()
-        elapsed = now - self._last_request
-        if elapsed < self.rate_limit:
-            time.sleep(self.rate_limit - elapsed)
-        self._last_request = time.time()
+        if self._bucket is not None:
+            self._bucket.acquire()
 
-    @exponential_backoff
+    @exponential_backoff()
     def _fetch(self, url: str) -> bytes:
-        if url in self._cache:
-            return self._cache[url]
+        cached = self._cache.get(url)
+        if cached is not None:
+            return cached
         self._sleep_if_needed()
         if self.session:
             resp = self.session.get(url, timeout=15)
@@ -99,15 +271,17 @@ class PublicFilingsFinder:
 
             with urlrequest.urlopen(url) as resp:  # type: ignore[call-arg]
                 data = resp.read()
-        self._cache[url] = data
+        self._cache.put(url, data)
         return data
 
     def _load_local(self, path: Path) -> bytes:
         key = str(path)
-        if key in self._cache:
-            return self._cache[key]
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
         data = path.read_bytes()
-        self._cache[key] = data
+        # Already on disk; only keep it in the in-memory tier.
+        self._cache.put(key, data, persist=False)
         return data
 
     # ------------------------------------------------------------------
@@ -119,10 +293,15 @@ class PublicFilingsFinder:
         """Search for filings matching criteria."""
 
         filings: List[Filing] = []
-        if self.local_dir:
+        # EINs are compared as strings, however the filing or caller wrote them.
+        ein = str(ein) if ein else None
+        indexed = self._query_index(ein=ein, org_name=org_name, year=year)
+        if indexed is not None:
+            filings = indexed
+        elif self.local_dir:
             for file in self.local_dir.glob("*.json"):
-                data = json.loads(file.read_text())
-                if ein and data.get("ein") != ein:
+                data = _loads(file.read_bytes())
+                if ein and str(data.get("ein")) != ein:
                     continue
                 if org_name and org_name.lower() not in data.get("organization_name", "").lower():
                     continue
@@ -135,6 +314,7 @@ class PublicFilingsFinder:
                         year=int(data.get("year", 0)),
                         form_type=data.get("form_type", ""),
                         local_path=file,
+                        parsed=data,
                     )
                 )
         else:  # pragma: no cover - placeholder for real API access
@@ -149,7 +329,7 @@ class PublicFilingsFinder:
             logger.info("Querying %s with %s", url, query)
             resp = self._fetch(url)
             try:
-                results = json.loads(resp)
+                results = _loads(resp)
             except json.JSONDecodeError:
                 return []
             for item in results.get("filings", []):
@@ -165,24 +345,77 @@ class PublicFilingsFinder:
         filings.sort(key=lambda f: f.year, reverse=True)
         return filings
 
+    def _query_index(
+        self, *, ein: str | None, org_name: str | None, year: int | None
+    ) -> Optional[List[Filing]]:
+        """Answer a local search from the Parquet index, if one is usable."""
+
+        if pa_ds is None or not self.local_dir:
+            return None
+        index = self.local_dir / FILINGS_INDEX
+        try:
+            metadata = pq.read_schema(index).metadata or {}
+        except (OSError, ValueError):
+            return None
+        if metadata.get(_INDEX_STATE_KEY) != _filings_state(self.local_dir).encode():
+            logger.debug("Filings index %s is stale; scanning directory", index)
+            return None
+        expr = None
+        conditions = []
+        if ein:
+            conditions.append(pc.field("ein") == ein)
+        if year:
+            conditions.append(pc.field("year") == year)
+        if org_name:
+            conditions.append(
+                pc.match_substring(pc.field("organization_name"), org_name, ignore_case=True)
+            )
+        for cond in conditions:
+            expr = cond if expr is None else expr & cond
+        table = pa_ds.dataset(index, format="parquet").to_table(filter=expr)
+        table = table.sort_by([("year", "descending")])
+        return [
+            Filing(
+                ein=row["ein"],
+                organization_name=row["organization_name"],
+                year=row["year"],
+                form_type=row["form_type"],
+                local_path=self.local_dir / row["path"],
+            )
+            for row in table.to_pylist()
+        ]
+
     # ------------------------------------------------------------------
     # Parsing logic
     # ------------------------------------------------------------------
-    def _parse_pdf(self, content: bytes, pattern: Pattern[str]) -> List[ContactInfo]:
-        if not pdfplumber:  # pragma: no cover - optional dependency
-            logger.warning("pdfplumber not available; skipping PDF parse")
-            return []
-        contacts: List[ContactInfo] = []
-        with pdfplumber.open(io.BytesIO(content)) as pdf:
-            text = "\n".join(page.extract_text() or "" for page in pdf.pages)
-        contacts.extend(self._extract_from_text(text, pattern))
-        return contacts
+    def _parse_pdf(
+        self, content: bytes, pattern: RoleMatcher, target_roles: Iterable[str] = ()
+    ) -> List[ContactInfo]:
+        return _scan_pdf(content, pattern, target_roles)
 
-    def _parse_html(self, html: str, pattern: Pattern[str]) -> List[ContactInfo]:
+    def _parse_pdfs(
+        self, contents: List[bytes], target_roles: List[str], pattern: RoleMatcher
+    ) -> List[List[ContactInfo]]:
+        """Parse several PDFs, spreading them over CPU cores when worthwhile."""
+
+        workers = os.cpu_count() or 1
+        if pdfplumber is None or workers < 2 or len(contents) < PDF_POOL_MIN:
+            return [self._parse_pdf(c, pattern, target_roles) for c in contents]
+        roles = tuple(target_roles)
+        # A few chunks per worker keeps every core busy while still batching
+        # the pickling of small documents.
+        chunksize = max(1, len(contents) // (workers * 4))
+        return list(
+            _get_pdf_pool().map(
+                _parse_pdf_worker, contents, [roles] * len(contents), chunksize=chunksize
+            )
+        )
+
+    def _parse_html(self, html: str, pattern: RoleMatcher) -> List[ContactInfo]:
         return self._extract_from_text(html, pattern)
 
     def _parse_structured_data(
-        self, data: Dict[str, object], pattern: Pattern[str], year: int
+        self, data: Dict[str, object], pattern: RoleMatcher, year: int
     ) -> List[ContactInfo]:
         contacts: List[ContactInfo] = []
         officers = data.get("officers")
@@ -191,7 +424,7 @@ class PublicFilingsFinder:
                 if not isinstance(officer, dict):
                     continue
                 title = str(officer.get("title", ""))
-                if not pattern.search(title.lower()):
+                if not pattern.search(title):
                     continue
                 info = ContactInfo(
                     name=str(officer.get("name", "")),
@@ -204,63 +437,108 @@ class PublicFilingsFinder:
         return contacts
 
     # ------------------------------------------------------------------
+    def _ensure_content(self, filing: Filing) -> Optional[bytes]:
+        if filing.content is None:
+            if filing.local_path:
+                filing.content = self._load_local(filing.local_path)
+            elif filing.url:
+                try:
+                    filing.content = self._fetch(filing.url)
+                except OSError as exc:
+                    logger.warning("Skipping filing %s: %s", filing.url, exc)
+        return filing.content
+
+    def _prefetch(self, filings: List[Filing]) -> None:
+        """Download remote filings concurrently, within the rate limit."""
+
+        remote = [
+            f for f in filings
+            if f.parsed is None and f.content is None and not f.local_path and f.url
+        ]
+        if len(remote) < 2 or self.max_concurrency < 2:
+            return
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(remote))) as executor:
+            list(executor.map(self._ensure_content, remote))
+
     def extract_contacts(self, filings: Iterable[Filing], target_roles: Iterable[str]) -> List[ContactInfo]:
-        pattern = re.compile("|".join(re.escape(r.lower()) for r in target_roles))
-        contacts: List[ContactInfo] = []
+        filings = list(filings)
+        target_roles = list(target_roles)
+        pattern = role_pattern(target_roles)
+        self._prefetch(filings)
+        results: List[List[ContactInfo]] = []
+        pdf_jobs: List[Tuple[int, Filing]] = []
         for filing in filings:
             year = filing.year
-            content = filing.content
+            if filing.parsed is not None:
+                results.append(self._parse_structured_data(filing.parsed, pattern, year))
+                continue
+            content = self._ensure_content(filing)
             if content is None:
-                if filing.local_path:
-                    content = self._load_local(filing.local_path)
-                elif filing.url:
-                    content = self._fetch(filing.url)
-                else:
-                    continue
-                filing.content = content
+                continue
             if filing.local_path and filing.local_path.suffix == ".json":
-                data = json.loads(content.decode("utf-8"))
-                contacts.extend(self._parse_structured_data(data, pattern, year))
+                filing.parsed = _loads(content)
+                parsed = self._parse_structured_data(filing.parsed, pattern, year)
             elif filing.local_path and filing.local_path.suffix in {".html", ".htm"}:
                 text = content.decode("utf-8", errors="ignore")
                 parsed = self._parse_html(text, pattern)
                 for c in parsed:
                     c.confidence = self._score_contact(year, c.title, c)
-                contacts.extend(parsed)
             else:
-                parsed = self._parse_pdf(content, pattern)
+                # Parsed together after the loop; keep the slot for ordering.
+                pdf_jobs.append((len(results), filing))
+                results.append([])
+                continue
+            results.append(parsed)
+        if pdf_jobs:
+            contents = [filing.content for _, filing in pdf_jobs]
+            parsed_pdfs = self._parse_pdfs(contents, target_roles, pattern)
+            for (slot, filing), parsed in zip(pdf_jobs, parsed_pdfs):
                 for c in parsed:
-                    c.confidence = self._score_contact(year, c.title, c)
-                contacts.extend(parsed)
-        return contacts
+                    c.confidence = self._score_contact(filing.year, c.title, c)
+                results[slot] = parsed
+        return list(chain.from_iterable(results))
 
     # ------------------------------------------------------------------
-    def _extract_from_text(self, text: str, pattern: Pattern[str]) -> List[ContactInfo]:
-        lines = [l.strip() for l in text.splitlines() if l.strip()]
-        results: List[ContactInfo] = []
-        for idx, line in enumerate(lines):
-            if pattern.search(line.lower()):
-                name = lines[idx - 1] if idx > 0 else ""
-                email = None
+    def _extract_from_text(self, text: str, pattern: RoleMatcher) -> List[ContactInfo]:
+        """Like :meth:`_scan_lines`, but with the whole text scanned in one pass."""
+        lines = [line for line in (l.strip() for l in text.splitlines()) if line]
+        contacts: List[ContactInfo] = []
+        for idx in matching_lines(lines, pattern):
+            email = lines[idx + 1] if idx + 1 < len(lines) and "@" in lines[idx + 1] else None
+            phone = None
+            if idx + 2 < len(lines) and _looks_like_phone(lines[idx + 2]):
+                phone = lines[idx + 2]
+            name = lines[idx - 1] if idx > 0 else ""
+            contacts.append(ContactInfo(name=name, title=lines[idx], email=email, phone=phone))
+        return contacts
+
+    @staticmethod
+    def _scan_lines(lines: Iterable[str], pattern: RoleMatcher) -> Iterator[ContactInfo]:
+        """Yield a contact for each non-blank line matching ``pattern``.
+
+        The previous line is taken as the name, the next as the email if it
+        contains ``@`` and the one after as the phone if it looks like one.
+        Lines are consumed lazily with two lines of lookahead.
+        """
+        stripped = (l.strip() for l in lines)
+        source = (l for l in stripped if l)
+        ahead = deque(islice(source, 3))
+        prev = ""
+        while ahead:
+            line = ahead.popleft()
+            following = next(source, None)
+            if following is not None:
+                ahead.append(following)
+            if pattern.search(line):
+                email = ahead[0] if ahead and "@" in ahead[0] else None
                 phone = None
-                if idx + 1 < len(lines) and "@" in lines[idx + 1]:
-                    email = lines[idx + 1]
-                if idx + 2 < len(lines) and re.search(r"\d{3}.*\d{4}", lines[idx + 2]):
-                    phone = lines[idx + 2]
-                results.append(ContactInfo(name=name, title=line, email=email, phone=phone))
-        return results
+                if len(ahead) > 1 and _looks_like_phone(ahead[1]):
+                    phone = ahead[1]
+                yield ContactInfo(name=prev, title=line, email=email, phone=phone)
+            prev = line
 
     def _score_contact(self, year: int, title: str, info: ContactInfo) -> float:
-        score = 0.5
-        current_year = datetime.utcnow().year
-        age = current_year - year
-        if age <= 1:
-            score += 0.3
-        elif age <= 3:
-            score += 0.1
-        if info.email or info.phone:
-            score += 0.1
-        if title:
-            score += 0.1
-        return min(score, 1.0)
+        age = self._current_year - year
+        bucket = 0 if age <= 1 else 1 if age <= 3 else 2
+        return _score(bucket, bool(info.email or info.phone), bool(title))
 
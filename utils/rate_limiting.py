@@ -2,33 +2,60 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import queue
 import random
+import threading
 import time
-from typing import Callable, TypeVar
+from concurrent.futures import Future
+from typing import Any, Callable, List, Optional, Tuple, Type, TypeVar
 
 
 logger = logging.getLogger(__name__)
 
 _T = TypeVar("_T")
 
+# Deadline (time.monotonic based) of the task running on the current thread.
+_task_deadline = threading.local()
 
-def exponential_backoff(func: Callable[..., _T], *, retries: int = 5, base_delay: float = 1.0) -> Callable[..., _T | None]:
-    """Wrap a function with exponential backoff retries."""
 
-    def wrapper(*args: object, **kwargs: object) -> _T | None:
-        delay = base_delay
-        for attempt in range(retries):
-            try:
-                return func(*args, **kwargs)
-            except Exception as exc:  # noqa: BLE001
-                logger.warning("Attempt %d failed: %s", attempt + 1, exc)
-                time.sleep(delay)
-                delay *= 2
-        logger.error("All retries failed for %s", func.__name__)
-        return None
+class RateLimitTimeoutError(RuntimeError):
+    """Raised when a rate-limited task cannot run before its deadline."""
+
+
+def exponential_backoff(
+    *,
+    retries: int = 5,
+    base_delay: float = 1.0,
+    max_delay: float = 60.0,
+    exceptions: Tuple[Type[BaseException], ...] = (OSError,),
+) -> Callable[[Callable[..., _T]], Callable[..., _T]]:
+    """Retry the decorated function with jittered exponential backoff.
+
+    Only ``exceptions`` are retried (``OSError`` covers socket, ``urllib`` and
+    ``requests`` errors); anything else propagates immediately. The last
+    failure is re-raised once ``retries`` attempts are exhausted.
+    """
+
+    def decorator(func: Callable[..., _T]) -> Callable[..., _T]:
+        @functools.wraps(func)
+        def wrapper(*args: object, **kwargs: object) -> _T:
+            for attempt in range(retries):
+                try:
+                    return func(*args, **kwargs)
+                except exceptions as exc:
+                    if attempt == retries - 1:
+                        logger.error("All %d attempts of %s failed", retries, func.__name__)
+                        raise
+                    delay = min(max_delay, base_delay * 2**attempt) + random.uniform(0, base_delay)
+                    logger.warning("Attempt %d failed: %s; retrying in %.1fs", attempt + 1, exc, delay)
+                    time.sleep(delay)
+            raise ValueError("retries must be at least 1")
 
-    return wrapper
+        return wrapper
+
+    return decorator
 
 
 def linkedin_delay(min_delay: float = 30.0, max_delay: float = 90.0) -> None:
@@ -56,3 +83,132 @@ class SessionRotator:
             self.counter = 0
             return True
         return False
+
+
+class TokenBucket:
+    """Thread-safe token-bucket limiter.
+
+    ``rate`` tokens are added per second up to ``capacity``. :meth:`acquire`
+    only sleeps when the bucket is empty, so callers within quota proceed
+    immediately. :meth:`penalize` temporarily halves the refill rate after a
+    throttling signal; repeated penalties back off exponentially.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0, *, jitter: float = 0.0) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.jitter = jitter
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._penalty = 1.0
+        self._penalty_until = 0.0
+        self._lock = threading.Lock()
+
+    def _current_rate(self, now: float) -> float:
+        if self._penalty < 1.0 and now >= self._penalty_until:
+            logger.info("Rate limit penalty expired")
+            self._penalty = 1.0
+        return self.rate * self._penalty
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until it is available. Returns the wait.
+
+        Inside a :class:`RateLimitedExecutor` task, raises
+        :class:`RateLimitTimeoutError` instead of sleeping past the task's
+        deadline.
+        """
+
+        deadline: Optional[float] = getattr(_task_deadline, "value", None)
+        with self._lock:
+            now = time.monotonic()
+            rate = self._current_rate(now)
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * rate)
+            self._last = now
+            wait = max(0.0, (1 - self._tokens) / rate)
+            if deadline is not None and now + wait > deadline:
+                raise RateLimitTimeoutError(f"Rate limit wait of {wait:.1f}s exceeds task deadline")
+            self._tokens -= 1
+        if wait > 0:
+            wait += random.uniform(0, self.jitter)
+            logger.debug("Rate limiter sleeping %.2f seconds", wait)
+            time.sleep(wait)
+        return wait
+
+    def penalize(self, *, window: float = 300.0) -> None:
+        """Halve the refill rate for ``window`` seconds and drain the bucket."""
+
+        with self._lock:
+            self._penalty = max(self._penalty / 2, 1 / 64)
+            self._penalty_until = time.monotonic() + window
+            self._tokens = min(self._tokens, 0.0)
+            logger.warning("Throttling detected; rate reduced to %.4f/s", self.rate * self._penalty)
+
+
+class RateLimitedExecutor:
+    """Thread pool fed by a bounded FIFO queue of deadline-tagged tasks.
+
+    :meth:`submit` blocks once ``max_queue`` tasks are waiting, so sustained
+    throttling applies back-pressure instead of growing memory. Tasks that
+    are still queued after their deadline fail with
+    :class:`RateLimitTimeoutError`, as do :class:`TokenBucket` waits that
+    would overrun it.
+    """
+
+    def __init__(
+        self, max_workers: int, *, max_queue: int | None = None, max_delay: float | None = None
+    ) -> None:
+        self.max_delay = max_delay
+        self._queue: "queue.Queue[Optional[Tuple[Future, Callable[..., Any], tuple, dict, Optional[float]]]]" = (
+            queue.Queue(maxsize=max_queue or max_workers * 4)
+        )
+        self._threads: List[threading.Thread] = []
+        for idx in range(max_workers):
+            thread = threading.Thread(target=self._worker, name=f"rate-limited-{idx}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def __enter__(self) -> "RateLimitedExecutor":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.shutdown()
+
+    def submit(
+        self, fn: Callable[..., _T], *args: Any, deadline: float | None = None, **kwargs: Any
+    ) -> "Future[_T]":
+        """Queue ``fn`` for execution, defaulting the deadline to ``max_delay`` from now."""
+
+        if deadline is None and self.max_delay is not None:
+            deadline = time.monotonic() + self.max_delay
+        future: "Future[_T]" = Future()
+        self._queue.put((future, fn, args, kwargs, deadline))
+        return future
+
+    def shutdown(self) -> None:
+        """Finish queued tasks and stop the workers."""
+
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+
+    def _worker(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            future, fn, args, kwargs, deadline = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            if deadline is not None and time.monotonic() > deadline:
+                future.set_exception(RateLimitTimeoutError("Task expired before it could run"))
+                continue
+            _task_deadline.value = deadline
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as exc:  # noqa: BLE001
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+            finally:
+                _task_deadline.value = None
@@ -7,13 +7,16 @@ full discovery pipeline and export basic reports.
 
 from __future__ import annotations
 
+import html
 import json
 import logging
 import random
 import time
-from dataclasses import asdict, dataclass
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from dataclasses import dataclass, fields, is_dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, TextIO, Tuple, TypeVar
 
 from .organization_processor import OrganizationProcessor, Organization
 from .website_scraper import WebsiteScraper, OrgRecord
@@ -22,8 +25,80 @@ from .contact_identifier import ContactIdentifier
 from .email_patterns import EmailPatternGenerator
 from .contact_integration import ContactIntegration, ContactRecord
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Threads used to run network-bound checks for several organizations at once.
+MAX_WORKERS = 8
+
+# Returned by TestFramework._check_component for names it does not know.
+_UNKNOWN = object()
+
+
+def _map_orgs(
+    fn: Callable[[Organization], _T], orgs: List[Organization], *, parallel: bool
+) -> List[_T]:
+    """Apply ``fn`` to each organization, concurrently unless ``parallel`` is false.
+
+    Results keep the order of ``orgs`` either way.
+    """
+    if not parallel or len(orgs) < 2:
+        return [fn(org) for org in orgs]
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(orgs))) as executor:
+        return list(executor.map(fn, orgs))
+
+
+@lru_cache(maxsize=None)
+def _public_fields(cls: type) -> Tuple[str, ...]:
+    return tuple(f.name for f in fields(cls) if not f.name.startswith("_"))
+
+
+def _as_dict(obj: object) -> Dict[str, object]:
+    """Shallow ``asdict`` for the flat records written to samples and reports.
+
+    Field names are looked up once per class and values are not copied;
+    nested records are converted by the JSON encoder's ``default`` hook.
+    """
+    return {name: getattr(obj, name) for name in _public_fields(type(obj))}
+
+
+def _json_default(obj: object) -> object:
+    # Component results hold dataclass records; anything else is shown as text.
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return _as_dict(obj)
+    return str(obj)
+
+
+def _dump(obj: object, fp: TextIO, *, indent: bool = False) -> None:
+    """Write ``obj`` as JSON to ``fp``, with orjson when it is installed.
+
+    orjson serializes dataclasses natively (skipping ``_``-prefixed fields,
+    like :func:`_as_dict`); otherwise the stdlib encoder streams into ``fp``.
+    """
+    if orjson:
+        option = orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        fp.write(orjson.dumps(obj, default=_json_default, option=option).decode())
+    else:
+        json.dump(obj, fp, indent=2 if indent else None, default=_json_default)
+
+
+class _EscapedWriter:
+    """File wrapper that HTML-escapes everything written through it."""
+
+    def __init__(self, fp: TextIO) -> None:
+        self._fp = fp
+
+    def write(self, text: str) -> int:
+        return self._fp.write(html.escape(text, quote=False))
+
 
 @dataclass
 class Sample:
@@ -40,10 +115,14 @@ class TestFramework:
         self.dataset_path = Path(full_dataset_path)
         self.components = components
         self.processor = OrganizationProcessor(self.dataset_path)
-        self.full_dataset = list(self.processor.organizations.values())
         self.samples_dir = Path(samples_dir)
         self.samples_dir.mkdir(parents=True, exist_ok=True)
 
+    @cached_property
+    def full_dataset(self) -> List[Organization]:
+        """Every organization in the dataset, built on first access."""
+        return list(self.processor.organizations.values())
+
     # ------------------------------------------------------------------
     # Sample management
     # ------------------------------------------------------------------
@@ -59,23 +138,27 @@ class TestFramework:
         """Create and persist a sample from the dataset."""
 
         constraints = constraints or {}
-        orgs = self.full_dataset
-        if eins:
-            ids = {int(e) for e in eins}
-            orgs = [o for o in orgs if o.ein in ids]
-        if constraints.get("min_plan_count"):
-            minimum = int(constraints["min_plan_count"])
-            orgs = [o for o in orgs if o.plan_count >= minimum]
-        if constraints.get("has_phone_number"):
-            orgs = [o for o in orgs if o.phone_num]
-        if random_seed is not None:
-            random.seed(random_seed)
-        if size < len(orgs):
-            orgs = random.sample(orgs, size)
+        # Filter and sample row numbers; records are only built for the sample.
+        rows = self.processor.select(
+            eins=eins or None,
+            min_plan_count=constraints.get("min_plan_count") or None,
+            has_phone_number=bool(constraints.get("has_phone_number")),
+        )
+        if size < len(rows):
+            # A private generator leaves the global one alone, so concurrent
+            # callers cannot disturb each other's seeded samples.
+            rows = random.Random(random_seed).sample(rows, size)
+        orgs = self.processor.records(rows)
         sample_name = name or f"sample_{size}_{random_seed if random_seed is not None else 'all'}"
         path = self.samples_dir / f"{sample_name}.json"
-        data = [asdict(o) for o in orgs]
-        path.write_text(json.dumps(data, indent=2))
+        # Written one organization per line so the whole document is never
+        # built in memory; the result is still a plain JSON array.
+        with path.open("w", encoding="utf-8") as fp:
+            fp.write("[")
+            for i, org in enumerate(orgs):
+                fp.write(",\n  " if i else "\n  ")
+                _dump(org, fp)
+            fp.write("\n]\n")
         logger.info("Sample written to %s", path)
         return Sample(organizations=orgs, path=path)
 
@@ -84,57 +167,90 @@ class TestFramework:
 
         p = Path(path)
         data = json.loads(p.read_text())
-        orgs = [Organization(**item) for item in data]
+        known = {f.name for f in fields(Organization)}
+        orgs = [Organization(**{k: v for k, v in item.items() if k in known}) for item in data]
         return Sample(organizations=orgs, path=p)
 
     # ------------------------------------------------------------------
     # Component tests
     # ------------------------------------------------------------------
-    def test_components(self, *, sample: Sample, components: Iterable[str]) -> Dict[str, object]:
-        """Run checks against individual components."""
+    def test_components(
+        self, *, sample: Sample, components: Iterable[str], parallel: bool = True
+    ) -> Dict[str, object]:
+        """Run checks against individual components.
 
-        results: Dict[str, object] = {}
-        for name in components:
+        Components are checked concurrently, one thread each, and
+        network-bound components also handle all organizations concurrently;
+        pass ``parallel=False`` to run everything one at a time. Each
+        ``<name>_time`` entry is the wall time of that component's check.
+        """
+
+        names = list(components)
+
+        def timed(name: str) -> Tuple[object, float]:
             start = time.time()
-            if name == "csv_processor":
-                results[name] = [o.ein for o in sample.organizations]
-            elif name == "website_scraper":
-                scraper: WebsiteScraper = self.components[name]  # type: ignore[assignment]
-                execs = []
-                for org in sample.organizations:
-                    execs.append(
-                        scraper.find_executives(OrgRecord(name=org.organization_name, website=None), target_roles=["General Counsel"])
-                    )
-                results[name] = execs
-            elif name == "filings_finder":
-                finder: PublicFilingsFinder = self.components[name]  # type: ignore[assignment]
-                contacts = []
-                for org in sample.organizations:
-                    filings = finder.find_filings(ein=str(org.ein))
-                    contacts.append(finder.extract_contacts(filings, ["General Counsel"]))
-                results[name] = contacts
-            elif name == "contact_identifier":
-                identifier: ContactIdentifier = self.components[name]  # type: ignore[assignment]
-                contacts = [
-                    {"name": "Jane Doe", "title": "Chief Financial Officer", "source": "website"}
-                ]
-                results[name] = identifier.categorize_contacts(contacts)
-            elif name == "email_generator":
-                gen: EmailPatternGenerator = self.components[name]  # type: ignore[assignment]
-                emails = []
-                for org in sample.organizations:
-                    contact = {"name": "Jane Doe", "organization": org.organization_name, "website": "https://example.com"}
-                    emails.append(gen.generate_candidates(contact))
-                results[name] = emails
-            elapsed = time.time() - start
+            value = self._check_component(name, sample, parallel=parallel)
+            return value, time.time() - start
+
+        if parallel and len(names) > 1:
+            with ThreadPoolExecutor(max_workers=len(names)) as executor:
+                outcomes = list(executor.map(timed, names))
+        else:
+            outcomes = [timed(name) for name in names]
+        results: Dict[str, object] = {}
+        for name, (value, elapsed) in zip(names, outcomes):
+            if value is not _UNKNOWN:
+                results[name] = value
             results[f"{name}_time"] = elapsed
         return results
 
+    def _check_component(self, name: str, sample: Sample, *, parallel: bool) -> object:
+        if name == "csv_processor":
+            return [o.ein for o in sample.organizations]
+        if name == "website_scraper":
+            scraper: WebsiteScraper = self.components[name]  # type: ignore[assignment]
+            return _map_orgs(
+                lambda org: scraper.find_executives(
+                    OrgRecord(name=org.organization_name, website=None), target_roles=["General Counsel"]
+                ),
+                sample.organizations,
+                parallel=parallel,
+            )
+        if name == "filings_finder":
+            finder: PublicFilingsFinder = self.components[name]  # type: ignore[assignment]
+            return _map_orgs(
+                lambda org: finder.extract_contacts(
+                    finder.find_filings(ein=str(org.ein)), ["General Counsel"]
+                ),
+                sample.organizations,
+                parallel=parallel,
+            )
+        if name == "contact_identifier":
+            identifier: ContactIdentifier = self.components[name]  # type: ignore[assignment]
+            contacts = [
+                {"name": "Jane Doe", "title": "Chief Financial Officer", "source": "website"}
+            ]
+            return identifier.categorize_contacts(contacts)
+        if name == "email_generator":
+            gen: EmailPatternGenerator = self.components[name]  # type: ignore[assignment]
+            emails = []
+            for org in sample.organizations:
+                contact = {"name": "Jane Doe", "organization": org.organization_name, "website": "https://example.com"}
+                emails.append(gen.generate_candidates(contact))
+            return emails
+        return _UNKNOWN
+
     # ------------------------------------------------------------------
     # Pipeline test
     # ------------------------------------------------------------------
-    def test_pipeline(self, *, sample: Sample, target_roles: Iterable[str]) -> List[ContactRecord]:
-        """Run the full contact discovery pipeline on a sample."""
+    def test_pipeline(
+        self, *, sample: Sample, target_roles: Iterable[str], parallel: bool = True
+    ) -> List[ContactRecord]:
+        """Run the full contact discovery pipeline on a sample.
+
+        Sources are queried for several organizations concurrently; the
+        results are then merged on the calling thread in sample order.
+        """
 
         integration = ContactIntegration(
             csv_processor=self.processor,
@@ -142,13 +258,18 @@ class TestFramework:
             filings_finder=self.components["filings_finder"],
             linkedin_finder=self.components.get("linkedin_finder"),
         )
-        all_contacts: Dict[str, ContactRecord] = {}
-        for org in sample.organizations:
+        target_roles = list(target_roles)
+
+        def collect(org: Organization) -> List[ContactRecord]:
             contacts = []
             contacts.extend(integration._from_website(org, target_roles))
             contacts.extend(integration._from_filings(org, target_roles))
             contacts.extend(integration._from_database(org, target_roles))
             contacts.extend(integration._from_linkedin(org, target_roles))
+            return contacts
+
+        all_contacts: Dict[str, ContactRecord] = {}
+        for contacts in _map_orgs(collect, sample.organizations, parallel=parallel):
             for c in contacts:
                 integration._merge_contacts(all_contacts, c)
         return list(all_contacts.values())
@@ -160,14 +281,14 @@ class TestFramework:
         """Write a simple HTML report summarizing results."""
 
         path = Path(output_path)
-        parts = ["<html><body>", "<h1>Test Report</h1>"]
-        parts.append("<h2>Component Results</h2><pre>")
-        parts.append(json.dumps(component_results, indent=2))
-        parts.append("</pre>")
-        parts.append("<h2>Pipeline Results</h2><pre>")
-        parts.append(json.dumps([asdict(r) for r in pipeline_results], indent=2))
-        parts.append("</pre></body></html>")
-        path.write_text("\n".join(parts), encoding="utf-8")
+        with path.open("w", encoding="utf-8") as fp:
+            escaped = _EscapedWriter(fp)
+            fp.write("<html><body>\n<h1>Test Report</h1>\n")
+            fp.write("<h2>Component Results</h2><pre>\n")
+            _dump(component_results, escaped, indent=True)
+            fp.write("\n</pre>\n<h2>Pipeline Results</h2><pre>\n")
+            _dump(pipeline_results, escaped, indent=True)
+            fp.write("\n</pre></body></html>")
         logger.info("Report written to %s", path)
 
     # ------------------------------------------------------------------
@@ -176,8 +297,8 @@ class TestFramework:
     def verify_results(self, *, discovered: List[ContactRecord], verified: Iterable[Dict[str, str]]) -> Dict[str, object]:
         """Compare discovered contacts with verified ground truth."""
 
-        disc_set = {(r.name.lower(), r.title.lower()) for r in discovered}
-        ver_set = {(v["name"].lower(), v["title"].lower()) for v in verified}
+        disc_set = {(r.name.casefold(), r.title.casefold()) for r in discovered}
+        ver_set = {(v["name"].casefold(), v["title"].casefold()) for v in verified}
         true_pos = disc_set & ver_set
         precision = len(true_pos) / len(disc_set) if disc_set else 0.0
         recall = len(true_pos) / len(ver_set) if ver_set else 0.0
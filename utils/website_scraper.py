@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
 import time
 from dataclasses import dataclass
-from typing import Iterable, List, Optional
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from urllib.parse import quote_plus, urljoin, urlparse
 
 try:
@@ -14,10 +16,73 @@ try:
 except Exception:  # pragma: no cover - fallback for minimal envs
     requests = None
 
+try:
+    from selectolax.parser import HTMLParser  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    HTMLParser = None
+
+try:
+    from defusedxml import ElementTree as SafeElementTree  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    SafeElementTree = None
+
 from urllib import robotparser, request as urlrequest
+from xml.etree import ElementTree
+
+from .caching import BlobCache, TextCache
+from .contact_identifier import matching_lines, role_pattern
+from .organization_processor import normalize_name
+from .rate_limiting import TokenBucket
 
 logger = logging.getLogger(__name__)
 
+# Characters decoded per chunk when streaming a page.
+FETCH_CHUNK = 64 * 1024
+# Seconds a site's parsed robots.txt is reused before being fetched again.
+ROBOTS_TTL = 3600.0
+# Largest sitemap, in decoded characters, that is parsed; larger ones are skipped.
+SITEMAP_MAX_CHARS = 10 * 1024 * 1024
+
+_TAG = re.compile(r"<[^>]+>")
+
+
+def html_text(html: str, separator: str = "\n") -> str:
+    """Return the visible text of ``html`` with text nodes joined by ``separator``.
+
+    Uses selectolax's C parser when installed, which also drops script and
+    style content; otherwise tags are replaced with a regex.
+    """
+    if HTMLParser is not None:
+        tree = HTMLParser(html)
+        tree.strip_tags(["script", "style", "noscript"])
+        root = tree.body or tree.root
+        return root.text(separator=separator) if root is not None else ""
+    return _TAG.sub(separator, html)
+
+
+_RESULT_MARKER = 'class="result__a"'
+
+
+def _first_result_href(html: str) -> Optional[str]:
+    """Return the ``href`` of the first DuckDuckGo result link in ``html``.
+
+    Scans with ``str.find`` for the marker class and an ``href`` later in the
+    same tag, which is all the former regex matched.
+    """
+    start = html.find(_RESULT_MARKER)
+    while start >= 0:
+        tag_end = html.find(">", start)
+        if tag_end < 0:
+            tag_end = len(html)
+        attr = html.find('href="', start, tag_end)
+        if attr >= 0:
+            value_start = attr + len('href="')
+            value_end = html.find('"', value_start, tag_end)
+            if value_end > value_start:
+                return html[value_start:value_end]
+        start = html.find(_RESULT_MARKER, start + len(_RESULT_MARKER))
+    return None
+
 
 @dataclass
 class Executive:
@@ -48,10 +113,34 @@ class WebsiteScraper:
         "team",
         "management",
     ]
+    LEADERSHIP_KEYWORDS: Tuple[str, ...] = ("leadership", "team", "executive", "management")
 
-    def __init__(self, *, rate_limit: float = 5.0, user_agent: str | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        rate_limit: float = 5.0,
+        user_agent: str | None = None,
+        website_cache: str | Path | None = None,
+        cache_dir: str | Path | None = None,
+        robots_ttl: float = ROBOTS_TTL,
+    ) -> None:
         self.rate_limit = rate_limit
-        self._last_request = 0.0
+        self.robots_ttl = robots_ttl
+        # Origin -> (parser or None if robots.txt was unreadable, fetch time).
+        self._robots: Dict[str, Tuple[Optional[robotparser.RobotFileParser], float]] = {}
+        # One lock per origin, so concurrent fetches read robots.txt once
+        # without one slow site holding up the others.
+        self._robots_locks: Dict[str, threading.Lock] = {}
+        # Organization name -> website found by search; persisted when a
+        # path is given so re-runs skip the search entirely.
+        self._websites: Dict[str, str] = {}
+        self._website_cache = TextCache(website_cache) if website_cache else None
+        # Successful page bodies by URL, so re-runs skip the network and the
+        # rate limit; robots.txt is still honoured on every fetch.
+        self._page_cache = BlobCache(cache_dir) if cache_dir else None
+        # One token bucket per host; hosts have independent quotas.
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._rate_lock = threading.Lock()
         self.user_agent = user_agent or "ContactDiscoveryBot/1.0 (+https://example.com/bot)"
         if requests:
             self.session = requests.Session()
@@ -62,82 +151,221 @@ class WebsiteScraper:
     # ------------------------------------------------------------------
     # Networking helpers
     # ------------------------------------------------------------------
-    def _sleep_if_needed(self) -> None:
-        """Respect configured rate limits between requests."""
+    def _sleep_if_needed(self, url: str) -> None:
+        """Respect configured rate limits between requests to the same host."""
 
-        now = time.time()
-        elapsed = now - self._last_request
-        if elapsed < self.rate_limit:
-            time.sleep(self.rate_limit - elapsed)
-        self._last_request = time.time()
+        if self.rate_limit <= 0:
+            return
+        host = urlparse(url).netloc
+        with self._rate_lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(rate=1 / self.rate_limit)
+        # Outside the lock, so waiting on one host never blocks another.
+        bucket.acquire()
+
+    def _robots_parser(self, origin: str) -> Optional[robotparser.RobotFileParser]:
+        with self._rate_lock:
+            lock = self._robots_locks.setdefault(origin, threading.Lock())
+        with lock:
+            cached = self._robots.get(origin)
+            if cached is not None and time.time() - cached[1] < self.robots_ttl:
+                return cached[0]
+            robots_url = urljoin(origin, "/robots.txt")
+            rp: Optional[robotparser.RobotFileParser] = robotparser.RobotFileParser()
+            rp.set_url(robots_url)
+            try:
+                rp.read()
+            except Exception as exc:  # noqa: BLE001
+                logger.info("robots.txt fetch failed for %s: %s", robots_url, exc)
+                rp = None
+            self._robots[origin] = (rp, time.time())
+        return rp
 
     def _allowed(self, url: str) -> bool:
-        """Check robots.txt to determine if scraping is allowed."""
+        """Check robots.txt to determine if scraping is allowed.
+
+        Each site's robots.txt is read once and reused for ``robots_ttl``
+        seconds.
+        """
 
         parsed = urlparse(url)
-        robots_url = urljoin(f"{parsed.scheme}://{parsed.netloc}", "/robots.txt")
-        rp = robotparser.RobotFileParser()
-        rp.set_url(robots_url)
-        try:
-            rp.read()
-            allowed = rp.can_fetch(self.user_agent, url)
-        except Exception as exc:  # noqa: BLE001
-            logger.info("robots.txt fetch failed for %s: %s", robots_url, exc)
-            allowed = True
-        return allowed
+        rp = self._robots_parser(f"{parsed.scheme}://{parsed.netloc}")
+        return rp is None or rp.can_fetch(self.user_agent, url)
 
-    def fetch(self, url: str) -> str:
-        """Fetch a URL if allowed by robots.txt."""
+    def _stream(self, url: str) -> Iterator[str]:
+        """Yield the decoded body of ``url`` in chunks, if allowed by robots.txt."""
 
         if not self._allowed(url):
             logger.warning("Blocked by robots.txt: %s", url)
-            return ""
-        self._sleep_if_needed()
+            return
+        if self._page_cache is not None:
+            cached = self._page_cache.get(url)
+            if cached is not None:
+                logger.debug("Page cache hit for %s", url)
+                yield cached.decode("utf-8")
+                return
+        self._sleep_if_needed(url)
+        parts: List[str] = []
+        if requests:
+            with self.session.get(url, timeout=10, stream=True) as resp:
+                if resp.status_code != 200:
+                    logger.warning("Non-200 status %s for %s", resp.status_code, url)
+                    return
+                if resp.encoding is None:
+                    resp.encoding = "utf-8"
+                for chunk in resp.iter_content(chunk_size=FETCH_CHUNK, decode_unicode=True):
+                    parts.append(chunk)
+                    yield chunk
+        else:  # pragma: no cover - fallback
+            with urlrequest.urlopen(url) as resp:
+                parts.append(resp.read().decode("utf-8", errors="ignore"))
+                yield parts[0]
+        if self._page_cache is not None:
+            self._page_cache.put(url, "".join(parts).encode("utf-8"))
+
+    def fetch(self, url: str) -> str:
+        """Fetch a URL if allowed by robots.txt."""
+
         try:
-            if requests:
-                resp = self.session.get(url, timeout=10)
-                if resp.status_code == 200:
-                    return resp.text
-                logger.warning("Non-200 status %s for %s", resp.status_code, url)
-            else:  # pragma: no cover - fallback
-                with urlrequest.urlopen(url) as resp:
-                    return resp.read().decode("utf-8", errors="ignore")
+            return "".join(self._stream(url))
         except Exception as exc:  # noqa: BLE001
             logger.error("Request error for %s: %s", url, exc)
         return ""
 
+    def fetch_matching(self, url: str, keywords: Iterable[str]) -> Tuple[str, bool]:
+        """Fetch ``url`` and report whether its text mentions any of ``keywords``.
+
+        Keywords are looked for in each chunk as it arrives, so the page is not
+        scanned again once downloaded; after the first hit the remaining
+        chunks are only collected.
+        """
+
+        keywords = [k.lower() for k in keywords]
+        overlap = max(map(len, keywords), default=0)
+        parts: List[str] = []
+        tail = ""
+        found = False
+        try:
+            for chunk in self._stream(url):
+                parts.append(chunk)
+                if found:
+                    continue
+                window = tail + chunk
+                # Hold back an unfinished tag so it is stripped whole next time.
+                cut = window.rfind("<")
+                if cut > window.rfind(">"):
+                    window, tail = window[:cut], window[cut:]
+                else:
+                    tail = ""
+                text = _TAG.sub(" ", window).lower()
+                found = any(k in text for k in keywords)
+                # Not text[-overlap:], which is the whole text when overlap is 0.
+                tail = text[len(text) - overlap:] + tail
+        except Exception as exc:  # noqa: BLE001
+            logger.error("Request error for %s: %s", url, exc)
+            return "", False
+        return "".join(parts), found
+
     # ------------------------------------------------------------------
     # Discovery helpers
     # ------------------------------------------------------------------
     def derive_website(self, org_name: str) -> Optional[str]:
-        """Attempt to discover a website using DuckDuckGo search."""
+        """Attempt to discover a website using DuckDuckGo search.
+
+        Found websites are remembered per organization name; failed searches
+        are retried on the next call.
+        """
+
+        key = normalize_name(org_name)
+        website = self._websites.get(key)
+        if website is None and self._website_cache is not None:
+            website = self._website_cache.get(key)
+        if website is None:
+            website = self._search_website(org_name)
+            if website is None:
+                return None
+            if self._website_cache is not None:
+                self._website_cache.put(key, website)
+        self._websites[key] = website
+        return website
 
+    def _search_website(self, org_name: str) -> Optional[str]:
         query = quote_plus(org_name)
         search_url = f"https://duckduckgo.com/html/?q={query}"
         html = self.fetch(search_url)
         if not html:
             return None
-        match = re.search(r'class="result__a"[^>]*href="([^"]+)"', html)
-        if match:
-            href = match.group(1)
-            if "uddg=" in href:
-                href = href.split("uddg=")[-1]
-            return href
-        return None
-
-    def _contains_leadership_keywords(self, html: str) -> bool:
-        text = re.sub(r"<[^>]+>", " ", html)
-        text = " ".join(text.split()).lower()
-        keywords = ["leadership", "team", "executive", "management"]
-        return any(k in text for k in keywords)
+        href = _first_result_href(html)
+        if href and "uddg=" in href:
+            href = href.split("uddg=")[-1]
+        return href
+
+    def _sitemap_urls(self, base_url: str) -> List[str]:
+        """Return same-site URLs from ``/sitemap.xml`` whose path names a leadership keyword.
+
+        The sitemap is fetched like any page, through robots.txt, the page
+        cache and the rate limit. It is untrusted input, so it is parsed with
+        defusedxml when installed; otherwise sitemaps declaring a DTD are
+        skipped, since entity expansion is the stdlib parser's weak spot.
+        Sitemaps larger than :data:`SITEMAP_MAX_CHARS` are never parsed.
+        """
+
+        sitemap_url = urljoin(base_url, "/sitemap.xml")
+        parts: List[str] = []
+        size = 0
+        try:
+            for chunk in self._stream(sitemap_url):
+                size += len(chunk)
+                if size > SITEMAP_MAX_CHARS:
+                    logger.debug("Sitemap %s is too large; ignoring it", sitemap_url)
+                    return []
+                parts.append(chunk)
+        except Exception as exc:  # noqa: BLE001
+            logger.error("Request error for %s: %s", sitemap_url, exc)
+            return []
+        xml = "".join(parts)
+        if not xml:
+            return []
+        if SafeElementTree is None and "<!DOCTYPE" in xml:
+            logger.debug("Sitemap %s declares a DTD; ignoring it", sitemap_url)
+            return []
+        try:
+            root = (SafeElementTree or ElementTree).fromstring(xml)
+        except (ElementTree.ParseError, ValueError) as exc:
+            # defusedxml rejects forbidden constructs with a ValueError subclass.
+            logger.debug("Unparseable sitemap for %s: %s", base_url, exc)
+            return []
+        host = urlparse(base_url).netloc
+        urls: List[str] = []
+        for loc in root.iter():
+            if not loc.tag.endswith("loc") or not loc.text:
+                continue
+            url = loc.text.strip()
+            parsed = urlparse(url)
+            if parsed.netloc != host or url.endswith(".xml"):
+                continue
+            if any(k in parsed.path.lower() for k in self.LEADERSHIP_KEYWORDS):
+                urls.append(url)
+        return urls[: len(self.DEFAULT_PATHS)]
 
     def find_leadership_page(self, base_url: str) -> tuple[str, str] | tuple[None, None]:
-        """Locate a page likely containing leadership information."""
+        """Locate a page likely containing leadership information.
+
+        Pages listed in the site's sitemap are tried first; the fixed
+        :attr:`DEFAULT_PATHS` are only guessed when it names none. Candidates
+        are tried in order and the first that mentions leadership wins. They
+        all share one host and so one rate limit, so probing them one at a
+        time is as fast as probing them concurrently, and no request is sent
+        after a hit.
+        """
 
-        for path in self.DEFAULT_PATHS:
-            url = urljoin(base_url, path)
-            html = self.fetch(url)
-            if html and self._contains_leadership_keywords(html):
+        candidates = self._sitemap_urls(base_url) or [
+            urljoin(base_url, path) for path in self.DEFAULT_PATHS
+        ]
+        for url in candidates:
+            html, found = self.fetch_matching(url, self.LEADERSHIP_KEYWORDS)
+            if found:
                 return url, html
         html = self.fetch(base_url)
         if html:
@@ -151,20 +379,17 @@ class WebsiteScraper:
     def parse_executives(html: str, target_roles: Iterable[str]) -> List[Executive]:
         """Extract executive information from HTML content."""
 
-        text = re.sub(r"<[^>]+>", "\n", html)
-        lines = [line.strip() for line in text.splitlines() if line.strip()]
+        text = html_text(html)
+        lines = [line for line in map(str.strip, text.splitlines()) if line]
         execs: List[Executive] = []
-        roles_pattern = re.compile("|".join(re.escape(r.lower()) for r in target_roles))
-        for idx, line in enumerate(lines):
-            match = roles_pattern.search(line.lower())
-            if match:
-                title = line.strip()
-                name = lines[idx - 1] if idx > 0 else ""
-                email = None
-                if idx + 1 < len(lines) and "@" in lines[idx + 1]:
-                    email = lines[idx + 1]
-                confidence = 0.8 if match else 0.5
-                execs.append(Executive(name=name, title=title, email=email, confidence=confidence))
+        roles_pattern = role_pattern(target_roles)
+        for idx in matching_lines(lines, roles_pattern):
+            title = lines[idx]
+            name = lines[idx - 1] if idx > 0 else ""
+            email = None
+            if idx + 1 < len(lines) and "@" in lines[idx + 1]:
+                email = lines[idx + 1]
+            execs.append(Executive(name=name, title=title, email=email, confidence=0.8))
         return execs
 
     # ------------------------------------------------------------------